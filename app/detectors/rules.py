@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 from app.detectors.ocr_utils import ocr_first_page_text
-from app.detectors.text_layer import has_domain, normalize_text
+from app.detectors.text_layer import compact_text, has_domain, normalize_text
 
 
 BANK_DOMAINS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
@@ -46,9 +46,10 @@ DENIZ_TEXT_MARKERS = (
 
 
 def detect_bank_by_text_domains(text_norm: str) -> Optional[dict]:
+    compact = compact_text(text_norm)
     for key, (bank_name, domains) in BANK_DOMAINS.items():
         for dom in domains:
-            if has_domain(text_norm, dom):
+            if has_domain(text_norm, dom, compact=compact):
                 return {
                     "key": key,
                     "bank": bank_name,
@@ -1,5 +1,7 @@
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from pypdf import PdfReader
 
@@ -7,40 +9,66 @@ from pypdf import PdfReader
 def extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     """Fast text-layer extraction (first N pages)."""
     try:
-        reader = PdfReader(str(pdf_path))
-        parts: list[str] = []
-        for page in reader.pages[:max_pages]:
-            parts.append(page.extract_text() or "")
+        with pdf_path.open("rb") as fp:
+            reader = PdfReader(fp)
+            parts: list[str] = []
+            for i in range(min(max_pages, len(reader.pages))):
+                page = reader.pages[i]
+                # no content stream -> no text; don't spin up the extractor
+                if "/Contents" not in page:
+                    parts.append("")
+                    continue
+                parts.append(page.extract_text() or "")
         return "\n".join(parts)
     except Exception:
         return ""
 
 
+_TR_FOLD = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
+_WS_RE = re.compile(r"\s+")
+
+
 def normalize_text(text: str) -> str:
     """Normalize for robust substring checks (TR letters + whitespace + dotted-i)."""
     t = (text or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
-    t = re.sub(r"\s+", " ", t)
+    t = t.translate(_TR_FOLD)
+    t = _WS_RE.sub(" ", t)
     return t.strip()
 
 
-def has_domain(text_norm: str, domain: str) -> bool:
-    """Website-domain matcher that survives PDF text-layer weirdness."""
+def compact_text(text_norm: str) -> str:
+    """text_norm with all whitespace removed (see has_domain)."""
+    return _WS_RE.sub("", text_norm or "")
+
+
+@lru_cache(maxsize=None)
+def _domain_re(dom_no_www: str) -> Optional[re.Pattern]:
+    parts = [re.escape(p) for p in dom_no_www.split(".") if p]
+    if not parts:
+        return None
+    pat = r"(?:www\s*\.\s*)?" + r"\s*\.\s*".join(parts)
+    return re.compile(pat, re.I)
+
+
+def has_domain(text_norm: str, domain: str, *, compact: Optional[str] = None) -> bool:
+    """
+    Website-domain matcher that survives PDF text-layer weirdness.
+
+    Callers checking many domains against one text can pass
+    compact=compact_text(text_norm) so it is built once, not per domain.
+    """
     t = text_norm or ""
-    compact = re.sub(r"\s+", "", t)
 
     dom = (domain or "").casefold().strip()
     if not dom:
         return False
 
-    if dom in t or dom in compact:
+    if dom in t:
+        return True
+    if compact is None:
+        compact = compact_text(t)
+    if dom in compact:
         return True
 
-    dom_no_www = dom.replace("www.", "")
-    parts = [re.escape(p) for p in dom_no_www.split(".") if p]
-    if not parts:
-        return False
-
-    pat = r"(?:www\s*\.\s*)?" + r"\s*\.\s*".join(parts)
-    return re.search(pat, t, flags=re.I) is not None
+    rx = _domain_re(dom.replace("www.", ""))
+    return rx is not None and rx.search(t) is not None
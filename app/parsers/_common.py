@@ -0,0 +1,102 @@
+"""Helpers shared by several bank parsers.
+
+Keep only bank-agnostic text utilities here; anything that knows a bank's
+labels stays in that bank's parser module.
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from pypdf import PdfReader
+
+
+# bidi marks + zero-width chars (deleted) and odd spaces (mapped to " "),
+# applied with a single str.translate pass instead of chained replace/re.sub
+_INVISIBLES_TRANS = dict.fromkeys(
+    map(ord, "\u200e\u200f\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069\ufeff\u200b\u200c\u200d")
+)
+# Turkish letters -> ASCII for label matching; apply after casefold(). Built once
+# here instead of a str.maketrans() in every parser's _norm call.
+_TR_FOLD = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
+
+_TEXT_TRANS = {
+    **_INVISIBLES_TRANS,
+    0x00A0: " ",
+    0x202F: " ",
+    0x2009: " ",
+}
+
+
+def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
+    with pdf_path.open("rb") as fp:
+        reader = PdfReader(fp)
+        parts = []
+        for i in range(min(max_pages, len(reader.pages))):
+            page = reader.pages[i]
+            # no content stream -> no text; don't spin up the extractor
+            if "/Contents" not in page:
+                parts.append("")
+                continue
+            parts.append(page.extract_text() or "")
+    return _tidy_text("\n".join(parts))
+
+
+def _tidy_text(s: str) -> str:
+    """Odd spaces -> " ", bidi/zero-width marks dropped (for text not read via _extract_text)."""
+    return (s or "").translate(_TEXT_TRANS)
+
+
+def _strip_invisibles(s: str) -> str:
+    """
+    Removes bidi/RTL marks + zero-width chars that often break regex matching in Arabic PDFs.
+    """
+    if not s:
+        return ""
+    return s.translate(_INVISIBLES_TRANS)
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _collapse_ws(s: str) -> str:
+    return _WS_RE.sub(" ", (s or "")).strip()
+
+
+def _clean(s: Optional[str]) -> Optional[str]:
+    """Like _collapse_ws, but None for empty / whitespace-only values."""
+    if not s:
+        return None
+    s = _WS_RE.sub(" ", s).strip()
+    return s or None
+
+
+def _first(pattern: str, text: str, flags: int = re.I) -> Optional[str]:
+    m = re.search(pattern, text, flags)
+    if not m:
+        return None
+    return (m.group(1) or "").strip()
+
+
+def _amount_try_to_tl(v: Optional[str]) -> Optional[str]:
+    if not v:
+        return None
+    v = v.strip()
+    v = v.replace("TRY", "TL")
+    return v
+
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def _iban_digits_only(v: Optional[str]) -> Optional[str]:
+    """
+    Strict IBAN builder: TR + 24 digits.
+    If the pdf masks digits with * then this returns None.
+    """
+    if not v:
+        return None
+    digits = "".join(_DIGITS_RE.findall(v))
+    if len(digits) != 24:
+        return None
+    return "TR" + digits
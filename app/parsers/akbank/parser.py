@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
@@ -13,13 +15,6 @@ def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     return "\n".join(parts).replace("\u00a0", " ").replace("\u202f", " ")
 
 
-def _clean(s: Optional[str]) -> Optional[str]:
-    if s is None:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
-
-
 def _iban_compact(s: Optional[str]) -> Optional[str]:
     if not s:
         return None
@@ -55,8 +50,7 @@ def _pick_transfer_amount(raw: str) -> Optional[str]:
 
 def _detect_tr_status(raw: str) -> str:
     t = (raw or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
+    t = t.translate(_TR_FOLD)
     if "iptal" in t:
         return "canceled"
     if "beklemede" in t or "isleniyor" in t:
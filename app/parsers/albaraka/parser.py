@@ -4,22 +4,16 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 # -------------------------
 # Utils
 # -------------------------
-def _clean(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
-
-
 def _norm(s: str) -> str:
     # OCR-safe normalize for matching labels (TR letters + whitespace)
     t = (s or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
+    t = t.translate(_TR_FOLD)
     t = re.sub(r"\s+", " ", t)
     return t.strip()
 
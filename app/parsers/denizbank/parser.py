@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
@@ -40,8 +42,7 @@ def _money_tl(raw: str, key: str) -> Optional[str]:
 
 def _detect_tr_status(raw: str) -> str:
     t = (raw or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
+    t = t.translate(_TR_FOLD)
 
     if "iptal" in t:
         return "canceled"
@@ -4,13 +4,19 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
     parts = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    return "\n".join(parts).replace("\u00a0", " ").replace("\u202f", " ")
+    return _prep_raw("\n".join(parts))
+
+
+def _prep_raw(raw: str) -> str:
+    return raw.replace("\u00a0", " ").replace("\u202f", " ")
 
 
 def _clean_spaces(s: str) -> str:
@@ -21,8 +27,7 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
@@ -200,8 +205,13 @@ def _find_transaction_ref(raw: str) -> Optional[str]:
     return None
 
 
-def parse_enpara(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_enpara(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
 
     return {
         "tr_status": _detect_tr_status(raw),
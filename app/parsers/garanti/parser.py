@@ -4,13 +4,18 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
     parts = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    raw = "\n".join(parts)
+    return _prep_raw("\n".join(parts))
+
+
+def _prep_raw(raw: str) -> str:
     return raw.replace("\u00a0", " ").replace("\u202f", " ")
 
 
@@ -22,8 +27,7 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")
-    tr_map = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr_map)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
@@ -132,8 +136,13 @@ def _detect_tr_status(raw_text: str) -> str:
     return "unknown"
 
 
-def parse_garanti(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_garanti(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
 
     sender = _find_sender_name(raw)
     receiver = _find_receiver_name(raw)
@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 # ----------------------------
 # Extract
@@ -31,18 +33,7 @@ def _norm(s: str) -> str:
 
     s = s.casefold()
 
-    tr = str.maketrans(
-        {
-            "ı": "i",
-            "ö": "o",
-            "ü": "u",
-            "ş": "s",
-            "ğ": "g",
-            "ç": "c",
-        }
-    )
-
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
 
     return s.strip()
@@ -298,9 +289,13 @@ def _detect_status(raw: str) -> str:
 # ----------------------------
 
 
-def parse_isbank(pdf_path: Path) -> Dict:
-
-    raw = _extract_text(pdf_path, 2)
+def parse_isbank(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, 2)
 
     sender = _find_sender(raw)
     receiver = _find_receiver(raw)
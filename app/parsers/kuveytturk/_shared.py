@@ -2,32 +2,14 @@ import re
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-from pypdf import PdfReader
-
-
-def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
-    reader = PdfReader(str(pdf_path))
-    parts = []
-    for page in reader.pages[:max_pages]:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts).replace("\u00a0", " ").replace("\u202f", " ")
-
-
-def _strip_invisibles(s: str) -> str:
-    """
-    Removes bidi/RTL marks + zero-width chars that often break regex matching in Arabic PDFs.
-    """
-    if not s:
-        return ""
-    return re.sub(r"[\u200e\u200f\u202a-\u202e\u2066-\u2069\ufeff\u200b-\u200d]", "", s)
+from app.parsers._common import _extract_text, _strip_invisibles, _TR_FOLD
 
 
 def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")  # dotted-i combining mark
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
@@ -4,6 +4,8 @@ from typing import Optional, Dict
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
@@ -17,8 +19,7 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")
-    tr_map = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr_map)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
@@ -94,8 +95,13 @@ def _detect_tr_status(raw_text: str) -> str:
     return "unknown"
 
 
-def parse_pttbank(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_pttbank(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
     lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
 
     receiver = _value_inline(lines, "Alıcı Adı")
@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 # -------------------------------------------------
 # CORE HELPERS
@@ -13,15 +15,12 @@ def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     parts: list[str] = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    # normalize common weird spaces
-    return "\n".join(parts).replace("\u00a0", " ").replace("\u202f", " ")
+    return _prep_raw("\n".join(parts))
 
 
-def _clean(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
+def _prep_raw(raw: str) -> str:
+    # normalize common weird spaces
+    return raw.replace("\u00a0", " ").replace("\u202f", " ")
 
 
 def _iban_compact(s: Optional[str]) -> Optional[str]:
@@ -34,8 +33,7 @@ def _iban_compact(s: Optional[str]) -> Optional[str]:
 
 def _norm_tr(s: str) -> str:
     t = (s or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    return re.sub(r"\s+", " ", t.translate(tr)).strip()
+    return re.sub(r"\s+", " ", t.translate(_TR_FOLD)).strip()
 
 
 # -------------------------------------------------
@@ -174,8 +172,13 @@ def _find_sender_fast(raw: str) -> Optional[str]:
 # -------------------------------------------------
 # MAIN PARSER
 # -------------------------------------------------
-def parse_qnb(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_qnb(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
 
     is_havale = bool(re.search(r"HESAPTAN\s+HESABA\s+HAVALE", raw, flags=re.IGNORECASE))
     is_fast = bool(re.search(r"GIDEN\s+FAST\s+EFT", raw, flags=re.IGNORECASE))
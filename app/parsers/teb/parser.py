@@ -4,13 +4,18 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
     parts = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    raw = "\n".join(parts)
+    return _prep_raw("\n".join(parts))
+
+
+def _prep_raw(raw: str) -> str:
     # normalize PDF weird spaces
     return raw.replace("\u00a0", " ").replace("\u202f", " ")
 
@@ -19,8 +24,7 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
@@ -28,13 +32,6 @@ def _norm(s: str) -> str:
 _WS = r"[\s\u00A0\u202F]+"
 
 
-def _clean(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
-
-
 def _find_all_account_owners(raw: str) -> list[str]:
     # IMPORTANT: "Hesap Sahibi:" is often MID-LINE (after "Müşteri Numarası:...")
     # So DO NOT anchor to ^ or \n.
@@ -155,8 +152,13 @@ def _detect_status(raw: str) -> str:
     return "unknown-manually"
 
 
-def parse_teb(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, 2)
+def parse_teb(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, 2)
 
     return {
         "tr_status": _detect_status(raw),
@@ -4,6 +4,8 @@ from typing import Optional, Dict
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 # ----------------------------
 # Extract
@@ -31,18 +33,7 @@ def _norm(s: str) -> str:
 
     s = s.casefold().replace("\u0307", "")
 
-    tr = str.maketrans(
-        {
-            "ı": "i",
-            "ö": "o",
-            "ü": "u",
-            "ş": "s",
-            "ğ": "g",
-            "ç": "c",
-        }
-    )
-
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
 
     return s.strip()
@@ -112,9 +103,13 @@ def _detect_status_tom(raw: str) -> str:
 # ----------------------------
 
 
-def parse_tombank(pdf_path: Path) -> Dict:
-
-    raw = _extract_text(pdf_path, 2)
+def parse_tombank(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, 2)
 
     lines = [l.strip() for l in raw.splitlines() if l.strip()]
 
@@ -5,6 +5,8 @@ from typing import Dict, Optional, Tuple
 
 from pypdf import PdfReader
 
+from app.parsers._common import _collapse_ws
+
 TR_UPPER = "A-ZÇĞİÖŞÜ"
 
 
@@ -13,18 +15,16 @@ def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     parts = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    raw = "\n".join(parts)
+    return _prep_raw("\n".join(parts))
+
 
+def _prep_raw(raw: str) -> str:
     raw = raw.replace("\u00a0", " ").replace("\u202f", " ")
     raw = unicodedata.normalize("NFC", raw)
     raw = raw.replace("I\u0307", "İ").replace("i\u0307", "i")
     return raw
 
 
-def _collapse_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
-
-
 def _match_text(raw: str) -> str:
     """
     For numeric fields: normalize Turkish letters -> ASCII, uppercase,
@@ -153,8 +153,13 @@ def _find_receiver_iban(raw: str) -> Optional[str]:
     return re.sub(r"\s+", " ", iban.group(0)).upper().strip()
 
 
-def parse_vakifbank(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_vakifbank(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
     match = _match_text(raw)
 
     sender, receiver = _find_sender_receiver(raw)
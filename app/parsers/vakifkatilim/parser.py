@@ -4,13 +4,18 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
     parts = []
     for page in reader.pages[:max_pages]:
         parts.append(page.extract_text() or "")
-    raw = "\n".join(parts)
+    return _prep_raw("\n".join(parts))
+
+
+def _prep_raw(raw: str) -> str:
     return raw.replace("\u00a0", " ").replace("\u202f", " ")
 
 
@@ -18,19 +23,11 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     s = s.casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    s = s.translate(tr)
+    s = s.translate(_TR_FOLD)
     s = re.sub(r"\s+", " ", s)
     return s.strip()
 
 
-def _clean(v: Optional[str]) -> Optional[str]:
-    if not v:
-        return None
-    v = re.sub(r"\s+", " ", v).strip()
-    return v or None
-
-
 def _find_time(raw: str) -> Optional[str]:
     # "İşlem Tarihi : 29/01/2026 17:20:12"
     m = re.search(
@@ -89,20 +86,30 @@ def _find_transaction_ref(raw: str) -> Optional[str]:
     return m.group(1).strip() if m else None
 
 
+# word-bounded on purpose: plain substrings would also hit e.g. "iadesi" in footers
+_CANCELED_RE = re.compile(r"\biptal\b|\biade\b|\bbasarisiz\b|\breddedildi\b|\bcancel")
+_PENDING_RE = re.compile(r"\bbeklemede\b|\bisleniyor\b|\bpending\b|\bprocessing\b")
+
+
 def _detect_status(raw: str) -> str:
     t = _norm(raw)
 
-    if re.search(r"\biptal\b|\biade\b|\bbasarisiz\b|\breddedildi\b|\bcancel", t):
+    if _CANCELED_RE.search(t):
         return "canceled"
-    if re.search(r"\bbeklemede\b|\bisleniyor\b|\bpending\b|\bprocessing\b", t):
+    if _PENDING_RE.search(t):
         return "pending"
 
     # This template doesn't explicitly say "successful/completed"
     return "unknown-manually"
 
 
-def parse_vakifkatilim(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, 2)
+def parse_vakifkatilim(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    raw = _prep_raw(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, 2)
 
     return {
         "tr_status": _detect_status(raw),
@@ -4,6 +4,8 @@ from typing import Dict, Optional
 
 from pypdf import PdfReader
 
+from app.parsers._common import _TR_FOLD
+
 
 def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
     reader = PdfReader(str(pdf_path))
@@ -23,18 +25,45 @@ def _norm(s: str) -> str:
     if not s:
         return ""
     t = s.casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
+    t = t.translate(_TR_FOLD)
     t = re.sub(r"\s+", " ", t)
     return t.strip()
 
 
-def _find_one(pattern: str, text: str, flags: int = 0) -> Optional[str]:
-    m = re.search(pattern, text, flags)
-    if not m:
-        return None
-    g = m.group(1) if m.lastindex else m.group(0)
-    return _clean_spaces(g)
+# One alternation per layout, walked once with finditer. Only the label is
+# consumed; the value is captured inside a lookahead, so a value that runs
+# over the next label can't hide it from the scan.
+_FAST_FIELDS_RE = re.compile(
+    r"İŞLEM TARİHİ(?=\s*:\s*(?P<transaction_time>[0-9]{2}\.[0-9]{2}\.[0-9]{4}\s+[0-9]{2}:[0-9]{2}:[0-9]{2}))"
+    r"|GÖNDEREN ADI(?=\s*:\s*(?P<sender_name>.+))"
+    r"|ALICI ADI(?=\s*:\s*(?P<receiver_name>.+))"
+    r"|ALICI HESAP(?=\s*:\s*(?P<receiver_iban>TR[0-9 ]{10,}))"
+    r"|GİDEN FAST TUTARI(?=\s*:\s*(?P<amount>[-\s]*[0-9][0-9\.\,]*))"
+    r"|SIRA NO/ID(?=\s*:\s*(?P<receipt_no>[0-9\- ]+\s*/\s*[0-9]+))"
+    r"|İŞLEM REF(?=\s*:\s*(?P<transaction_ref>[0-9]+))"
+)
+
+_HAVALE_FIELDS_RE = re.compile(
+    r"İŞLEM TARİHİ(?=\s*:\s*(?P<transaction_time>[0-9]{2}\.[0-9]{2}\.[0-9]{4}\s+[0-9]{2}:[0-9]{2}:[0-9]{2}))"
+    r"|ALACAKLI ADI(?=\s*:\s*(?P<receiver_name>.+))"
+    r"|ALACAKLI HESAP(?=\s*:\s*(?:[0-9]+/IBAN:)?\s*(?P<receiver_iban>TR[0-9 ]{10,}))"
+    r"|ISLEM TUTARI(?=\s*:\s*(?P<amount>[-\s]*[0-9][0-9\.\,]*))"
+    # HAVALE receipt number is the BELGE NUMARASI (MOA...)
+    r"|BELGE NUMARASI(?=\s*:\s*(?P<receipt_no>[A-Z0-9]+))"
+    r"|İŞLEM REF(?=\s*:\s*(?P<transaction_ref>[0-9]+))"
+)
+
+
+def _scan_fields(rx: re.Pattern, text: str) -> Dict[str, Optional[str]]:
+    """First hit per named group, in one pass; stops once every field is filled."""
+    found: Dict[str, Optional[str]] = {}
+    for m in rx.finditer(text):
+        name = m.lastgroup
+        if name not in found:
+            found[name] = _clean_spaces(m.group(name))
+            if len(found) == rx.groups:
+                break
+    return found
 
 
 def _strip_leading_minus(v: Optional[str]) -> Optional[str]:
@@ -63,8 +92,8 @@ def _detect_variant(text_norm: str) -> str:
     return "UNKNOWN"
 
 
-def _detect_tr_status(raw: str) -> str:
-    n = _norm(raw)
+def _detect_tr_status(raw: str, raw_norm: Optional[str] = None) -> str:
+    n = raw_norm if raw_norm is not None else _norm(raw)
     if "tamamlanmistir" in n or "isleminiz an itibariyle" in n:
         return "completed"
     if "hesabiniza borc/alacak kaydedilmistir" in n:
@@ -76,47 +105,60 @@ def _detect_tr_status(raw: str) -> str:
     return "unknown"
 
 
+# non-name lines after AÇIKLAMA (on _norm'd text): fee/transfer labels, IBANs,
+# or "tr" together with a digit anywhere on the line
+_SKIP_LINE_RE = re.compile(r"havale ucreti|giden havale|iban|tr.*\d|\d.*tr")
+
+
+# same test as _norm(line).startswith("aciklama:"), straight on the raw text
+_ACIKLAMA_RE = re.compile(r"^[^\S\n]*a[cç][iı]\u0307?klama:", re.I | re.M)
+
+# footer/header lines that can follow AÇIKLAMA but are never the name;
+# a tuple so one str.startswith call tests them all
+_BAD_NAME_STARTS = (
+    "e-dekont",
+    "ticari unvan",
+    "buyuk mukellefler",
+    "web adresi",
+    "ticaret sicil",
+    "plaza",
+    "mersis no",
+    "mobil",
+    "sistem",
+)
+
+
 def _sender_from_aciklama_block(raw: str) -> Optional[str]:
     """
     HAVALE PDFs: sender name is usually an unlabeled standalone line after 'AÇIKLAMA:...'
     Example shows AÇIKLAMA line then name (e.g., 'ALİ IŞIKSOY'). :contentReference[oaicite:2]{index=2}
     """
-    lines = [re.sub(r"\s+", " ", ln).strip() for ln in raw.splitlines()]
-    lines = [ln for ln in lines if ln]
+    # one line separator: str.splitlines() also breaks on \r, \v, \f, \x1c-\x1e, \x85, \u2028
+    raw = "\n".join(raw.splitlines())
 
     # Find first line that starts with AÇIKLAMA:
-    idx = None
-    for i, ln in enumerate(lines):
-        if _norm(ln).startswith("aciklama:"):
-            idx = i
-            break
-    if idx is None:
+    m = _ACIKLAMA_RE.search(raw)
+    if not m:
         return None
 
     # candidate: first "clean" line after it
-    bad_starts = (
-        "e-dekont",
-        "ticari unvan",
-        "buyuk mukellefler",
-        "web adresi",
-        "ticaret sicil",
-        "plaza",
-        "mersis no",
-        "mobil",
-        "sistem",
-    )
-
-    for j in range(idx + 1, min(idx + 8, len(lines))):
-        ln = lines[j]
+    # walk at most 7 non-empty lines after the marker; the rest of the page is never split
+    pos = raw.find("\n", m.end())
+    seen = 0
+    while pos != -1 and seen < 7:
+        start = pos + 1
+        pos = raw.find("\n", start)
+        ln = _clean_spaces(raw[start:] if pos == -1 else raw[start:pos])
+        if not ln:
+            continue
+        seen += 1
         n = _norm(ln)
 
-        if any(n.startswith(bs) for bs in bad_starts):
+        if n.startswith(_BAD_NAME_STARTS):
             continue
 
         # skip obvious non-name lines
-        if "havale ucreti" in n or "giden havale" in n:
-            continue
-        if "iban" in n or "tr" in n and any(ch.isdigit() for ch in ln):
+        if _SKIP_LINE_RE.search(n):
             continue
         if len(ln) < 3:
             continue
@@ -126,33 +168,36 @@ def _sender_from_aciklama_block(raw: str) -> Optional[str]:
     return None
 
 
-def parse_yapikredi_fast(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_yapikredi_fast(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,
+) -> Dict:
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
+    # caller's text_norm only describes text_raw, not a freshly extracted text
+    raw_norm = text_norm if (text_norm is not None and raw is text_raw) else _norm(raw)
 
-    transaction_time = _find_one(
-        r"İŞLEM TARİHİ\s*:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4}\s+[0-9]{2}:[0-9]{2}:[0-9]{2})",
-        raw,
-    )
+    f = _scan_fields(_FAST_FIELDS_RE, raw)
+    transaction_time = f.get("transaction_time")
 
-    sender = _find_one(r"GÖNDEREN ADI\s*:\s*(.+)", raw)
-    sender = _trim_sender_name(sender)
+    sender = _trim_sender_name(f.get("sender_name"))
 
-    receiver = _find_one(r"ALICI ADI\s*:\s*(.+)", raw)
+    receiver = f.get("receiver_name")
 
-    receiver_iban = _find_one(r"ALICI HESAP\s*:\s*(TR[0-9 ]{10,})", raw)
+    receiver_iban = f.get("receiver_iban")
     if receiver_iban:
         receiver_iban = receiver_iban.replace(" ", "")
 
-    amount = _find_one(r"GİDEN FAST TUTARI\s*:\s*([-\s]*[0-9][0-9\.\,]*)", raw)
-    amount = _strip_leading_minus(amount)
+    amount = _strip_leading_minus(f.get("amount"))
     if amount and "tl" not in _norm(amount):
         amount = f"{amount} TL"
 
-    receipt_no = _find_one(r"SIRA NO/ID\s*:\s*([0-9\- ]+\s*/\s*[0-9]+)", raw)
-    transaction_ref = _find_one(r"İŞLEM REF\s*:\s*([0-9]+)", raw)
+    receipt_no = f.get("receipt_no")
+    transaction_ref = f.get("transaction_ref")
 
     return {
-        "tr_status": _detect_tr_status(raw),
+        "tr_status": _detect_tr_status(raw, raw_norm),
         "sender_name": sender,
         "receiver_name": receiver,
         "receiver_iban": receiver_iban,
@@ -163,33 +208,36 @@ def parse_yapikredi_fast(pdf_path: Path) -> Dict:
     }
 
 
-def parse_yapikredi_havale(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_yapikredi_havale(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,
+) -> Dict:
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
+    # caller's text_norm only describes text_raw, not a freshly extracted text
+    raw_norm = text_norm if (text_norm is not None and raw is text_raw) else _norm(raw)
 
-    transaction_time = _find_one(
-        r"İŞLEM TARİHİ\s*:\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4}\s+[0-9]{2}:[0-9]{2}:[0-9]{2})",
-        raw,
-    )
+    f = _scan_fields(_HAVALE_FIELDS_RE, raw)
+    transaction_time = f.get("transaction_time")
 
-    receiver = _find_one(r"ALACAKLI ADI\s*:\s*(.+)", raw)
+    receiver = f.get("receiver_name")
 
-    receiver_iban = _find_one(r"ALACAKLI HESAP\s*:\s*(?:[0-9]+/IBAN:)?\s*(TR[0-9 ]{10,})", raw)
+    receiver_iban = f.get("receiver_iban")
     if receiver_iban:
         receiver_iban = receiver_iban.replace(" ", "")
 
-    amount = _find_one(r"ISLEM TUTARI\s*:\s*([-\s]*[0-9][0-9\.\,]*)", raw)
-    amount = _strip_leading_minus(amount)
+    amount = _strip_leading_minus(f.get("amount"))
     if amount and "tl" not in _norm(amount):
         amount = f"{amount} TL"
 
-    # HAVALE receipt number is the BELGE NUMARASI (MOA...)
-    receipt_no = _find_one(r"BELGE NUMARASI\s*:\s*([A-Z0-9]+)", raw)
-    transaction_ref = _find_one(r"İŞLEM REF\s*:\s*([0-9]+)", raw)
+    receipt_no = f.get("receipt_no")
+    transaction_ref = f.get("transaction_ref")
 
     sender = _sender_from_aciklama_block(raw)
 
     return {
-        "tr_status": _detect_tr_status(raw),
+        "tr_status": _detect_tr_status(raw, raw_norm),
         "sender_name": sender,
         "receiver_name": receiver,
         "receiver_iban": receiver_iban,
@@ -200,17 +248,24 @@ def parse_yapikredi_havale(pdf_path: Path) -> Dict:
     }
 
 
-def parse_yapikredi(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
-    v = _detect_variant(_norm(raw))
+def parse_yapikredi(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,
+) -> Dict:
+    # extract + normalize once and hand both down; sub-parsers don't redo either
+    raw = text_raw if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
+    raw_norm = text_norm if (text_norm is not None and raw is text_raw) else _norm(raw)
+    v = _detect_variant(raw_norm)
 
     if v == "FAST":
-        return parse_yapikredi_fast(pdf_path)
+        return parse_yapikredi_fast(pdf_path, text_raw=raw, text_norm=raw_norm)
     if v == "HAVALE":
-        return parse_yapikredi_havale(pdf_path)
+        return parse_yapikredi_havale(pdf_path, text_raw=raw, text_norm=raw_norm)
 
     # fallback: try FAST first, then HAVALE
     try:
-        return parse_yapikredi_fast(pdf_path)
+        return parse_yapikredi_fast(pdf_path, text_raw=raw, text_norm=raw_norm)
     except Exception:
-        return parse_yapikredi_havale(pdf_path)
+        return parse_yapikredi_havale(pdf_path, text_raw=raw, text_norm=raw_norm)
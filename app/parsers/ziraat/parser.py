@@ -2,62 +2,42 @@ import re
 from pathlib import Path
 from typing import Dict, Optional
 
-from pypdf import PdfReader
+from app.parsers._common import (
+    _amount_try_to_tl,
+    _collapse_ws,
+    _extract_text,
+    _first,
+    _iban_digits_only,
+    _tidy_text,
+)
 
 
-def _extract_text(pdf_path: Path, max_pages: int = 2) -> str:
-    reader = PdfReader(str(pdf_path))
-    parts = []
-    for page in reader.pages[:max_pages]:
-        parts.append(page.extract_text() or "")
-    return "\n".join(parts).replace("\u00a0", " ").replace("\u202f", " ")
-
-
-def _first(pattern: str, text: str, flags: int = re.I) -> Optional[str]:
-    m = re.search(pattern, text, flags)
-    if not m:
-        return None
-    return (m.group(1) or "").strip()
+_ISLEM_TARIHI_RE = re.compile(
+    r"İŞLEM\s*TARİHİ\s*[=:]\s*(\d{2})/(\d{2})/(\d{4})-(\d{2}:\d{2}:\d{2})",
+    re.I,
+)
 
 
 def _first_ddmmyyyy_time(text: str) -> Optional[str]:
-    m = re.search(
-        r"İŞLEM\s*TARİHİ\s*:\s*(\d{2})/(\d{2})/(\d{4})-(\d{2}:\d{2}:\d{2})",
-        text,
-        re.I,
-    )
-    if not m:
-        # fallback: sometimes OCR/text-layer changes : to =
-        m = re.search(
-            r"İŞLEM\s*TARİHİ\s*[=:]\s*(\d{2})/(\d{2})/(\d{4})-(\d{2}:\d{2}:\d{2})",
-            text,
-            re.I,
-        )
+    # sometimes OCR/text-layer changes : to =
+    m = _ISLEM_TARIHI_RE.search(text)
     if not m:
         return None
     dd, mm, yyyy, hhmmss = m.group(1), m.group(2), m.group(3), m.group(4)
     return f"{dd}.{mm}.{yyyy} {hhmmss}"
 
 
-def _amount_try_to_tl(v: Optional[str]) -> Optional[str]:
-    if not v:
-        return None
-    v = v.strip()
-    v = v.replace("TRY", "TL")
-    return v
+_FAST_SORGU_RE = re.compile(r"Fast\s*Sorgu\s*No\s*:\s*([0-9]+)", re.I)
 
 
-def _iban_digits_only(v: Optional[str]) -> Optional[str]:
-    """
-    Strict IBAN builder: TR + 24 digits.
-    If the pdf masks digits with * then this returns None.
-    """
-    if not v:
-        return None
-    digits = "".join(ch for ch in v if ch.isdigit())
-    if len(digits) != 24:
-        return None
-    return "TR" + digits
+def _find_fast_sorgu_no(text: str) -> Optional[str]:
+    m = _FAST_SORGU_RE.search(text)
+    return m.group(1) if m else None
+
+
+# bounded run: a masked IBAN with spaces is ~36 chars after "TR<digit>"
+_MASKED_IBAN_RE = re.compile(r"\bTR[0-9][0-9A-Z *]{8,40}\b", re.I)
+_TR_RE = re.compile(r"TR", re.I)
 
 
 def _iban_masked_or_full(v: Optional[str]) -> Optional[str]:
@@ -74,23 +54,30 @@ def _iban_masked_or_full(v: Optional[str]) -> Optional[str]:
 
     # masked fallback: keep TR + digits + * + spaces
     # and cut trailing junk if OCR glued it.
-    m = re.search(r"\bTR[0-9][0-9A-Z *]{8,}\b", v, flags=re.I)
+    m = _MASKED_IBAN_RE.search(v)
     if not m:
         # sometimes the line continues; take from first TR
-        i = v.upper().find("TR")
-        if i == -1:
+        m = _TR_RE.search(v)
+        if not m:
             return None
-        chunk = v[i:]
+        chunk = v[m.start() :]
     else:
         chunk = m.group(0)
 
-    chunk = re.sub(r"\s+", " ", chunk).strip()
+    chunk = _collapse_ws(chunk)
     # If it’s extremely short, it’s not useful
     return chunk if len(chunk) >= 10 else None
 
 
-def parse_ziraat(pdf_path: Path) -> Dict:
-    raw = _extract_text(pdf_path, max_pages=2)
+def parse_ziraat(
+    pdf_path: Path,
+    *,
+    text_raw: Optional[str] = None,
+    text_norm: Optional[str] = None,  # unused
+) -> Dict:
+    # reuse the request's cached text layer, with the same cleanup _extract_text applies
+    raw = _tidy_text(text_raw) if (text_raw is not None and text_raw.strip()) else _extract_text(pdf_path, max_pages=2)
+    # one uppercased copy for all variant markers
     up = raw.upper()
 
     is_fast = (
@@ -128,7 +115,7 @@ def parse_ziraat(pdf_path: Path) -> Dict:
         amount = _amount_try_to_tl(f"{amt} TL" if amt else None)
 
         # receipt_no = Fast Sorgu No (this is what you already show in logs)
-        receipt_no = _first(r"Fast\s*Sorgu\s*No\s*:\s*([0-9]+)", raw)
+        receipt_no = _find_fast_sorgu_no(raw)
 
     elif is_havale:
         sender_name = _first(r"SAYIN\s*\n\s*([^\n]+)", raw)
@@ -1,30 +1,42 @@
 import re
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from pypdf import PdfReader
 
+from app.parsers._common import _clean, _TR_FOLD
+
 
 # -----------------------------
 # Basics
 # -----------------------------
-def _clean(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return None
-    s = re.sub(r"\s+", " ", s).strip()
-    return s or None
+_WS_RE = re.compile(r"\s+")
+# applied after casefold(): "İ" -> "i\u0307", so the combining dot is dropped here too
+_NORM_TRANS = {**_TR_FOLD, 0x0307: None, 0x00A0: " ", 0x202F: " "}
 
 
 def _norm(s: str) -> str:
-    t = (s or "").casefold().replace("\u0307", "")
-    tr = str.maketrans({"ı": "i", "ö": "o", "ü": "u", "ş": "s", "ğ": "g", "ç": "c"})
-    t = t.translate(tr)
-    t = t.replace("\u00a0", " ").replace("\u202f", " ")
-    t = re.sub(r"\s+", " ", t)
-    return t.strip()
+    return _WS_RE.sub(" ", (s or "").casefold().translate(_NORM_TRANS)).strip()
 
 
-def _extract_text_layer(pdf_path: Path, max_pages: int = 1) -> str:
+def _rows_text(page, tol: float = 2.0) -> str:
+    """PyMuPDF words -> visual rows (same shape as our OCR output)."""
+    words = page.get_text("words")
+    words.sort(key=lambda w: (w[3], w[0]))
+
+    rows: list[list] = []
+    base = None
+    for w in words:
+        if base is None or abs(w[3] - base) > tol:
+            rows.append([])
+            base = w[3]
+        rows[-1].append(w)
+
+    return "\n".join(" ".join(w[4] for w in sorted(r, key=lambda w: w[0])) for r in rows)
+
+
+def _text_layer_pypdf(pdf_path: Path, max_pages: int = 1) -> str:
     try:
         reader = PdfReader(str(pdf_path))
         return "\n".join((p.extract_text() or "") for p in reader.pages[:max_pages])
@@ -32,16 +44,107 @@ def _extract_text_layer(pdf_path: Path, max_pages: int = 1) -> str:
         return ""
 
 
+def _extract_text_layer(pdf_path: Path, max_pages: int = 1) -> str:
+    # PyMuPDF (in requirements.txt) extracts in C, ~10x faster than pypdf. Its
+    # rows are rebuilt from word boxes because the field patterns below were
+    # written against OCR-style "label : value" lines; tests check both paths
+    # yield the same fields. pypdf stays as the fallback for a missing install.
+    try:
+        import pymupdf
+    except Exception:
+        pymupdf = None
+
+    if pymupdf is not None:
+        try:
+            with pymupdf.open(str(pdf_path)) as doc:
+                return "\n".join(
+                    _rows_text(doc[i]) for i in range(min(max_pages, doc.page_count))
+                )
+        except Exception:
+            pass
+
+    return _text_layer_pypdf(pdf_path, max_pages)
+
+
 # -----------------------------
 # OCR helpers
 # -----------------------------
+# tesserocr (optional) binds libtesseract directly, keeping the model loaded
+# instead of a tesseract subprocess + temp PNG per image. Each API holds an
+# LSTM model (tens of MB), so a few per language are shared by all threads
+# rather than one per thread.
+_TESS_PER_LANG = 2
+_TESS_COND = threading.Condition()
+_TESS_IDLE: Dict[str, list] = {}
+_TESS_MADE: Dict[str, int] = {}
+_TESS_FAILED: set = set()
+
+
+def _tess_acquire(lang: str):
+    """An idle API for `lang` (waits while all are busy); None if tesserocr can't load it."""
+    with _TESS_COND:
+        while True:
+            if lang in _TESS_FAILED:
+                return None
+            idle = _TESS_IDLE.setdefault(lang, [])
+            if idle:
+                return idle.pop()
+            if _TESS_MADE.get(lang, 0) < _TESS_PER_LANG:
+                _TESS_MADE[lang] = _TESS_MADE.get(lang, 0) + 1
+                break
+            _TESS_COND.wait()
+
+    # loading the model takes a while: not under the lock
+    try:
+        from tesserocr import OEM, PyTessBaseAPI
+
+        api = PyTessBaseAPI(lang=lang, oem=OEM.LSTM_ONLY)
+        api.SetVariable("tessedit_do_invert", "0")
+        return api
+    except Exception:
+        with _TESS_COND:
+            _TESS_MADE[lang] -= 1
+            _TESS_FAILED.add(lang)
+            _TESS_COND.notify_all()
+        return None
+
+
+def _tess_release(lang: str, api) -> None:
+    with _TESS_COND:
+        _TESS_IDLE[lang].append(api)
+        # waiters may want another language: wake them all to recheck
+        _TESS_COND.notify_all()
+
+
+def _tess_text(img, lang: str) -> Optional[str]:
+    """None = tesserocr can't do `lang`, caller tries the next option."""
+    api = _tess_acquire(lang)
+    if api is None:
+        return None
+    try:
+        api.SetPageSegMode(6)
+        api.SetImage(img)
+        return api.GetUTF8Text() or ""
+    except Exception:
+        return None
+    finally:
+        _tess_release(lang, api)
+
+
 def _ocr_image(img) -> str:
+    for lang in ("tur+eng", "eng"):
+        txt = _tess_text(img, lang)
+        # a missing tur model still leaves tesserocr's eng to try
+        if txt is not None and (txt.strip() or lang == "eng"):
+            return txt
+
     try:
         import pytesseract
     except Exception:
         return ""
 
-    config = "--psm 6"
+    # LSTM engine only (skips the legacy pass) and no inverted-image retry
+    config = "--oem 1 --psm 6 -c tessedit_do_invert=0"
     try:
         txt = pytesseract.image_to_string(img, lang="tur+eng", config=config) or ""
         if txt.strip():
@@ -55,23 +158,62 @@ def _ocr_image(img) -> str:
         return ""
 
 
-def _ocr_first_page(pdf_path: Path, dpi: int = 320) -> str:
+def _prep(img):
+    from PIL import ImageOps
+
+    return ImageOps.autocontrast(ImageOps.grayscale(img))
+
+
+def _render_pymupdf(pdf_path: Path, dpi: int):
+    """Grayscale render of page 1; None if PyMuPDF / PIL are unavailable."""
+    try:
+        import pymupdf
+        from PIL import Image, ImageOps
+    except Exception:
+        return None
+
+    try:
+        with pymupdf.open(str(pdf_path)) as doc:
+            zoom = dpi / 72
+            pix = doc[0].get_pixmap(
+                matrix=pymupdf.Matrix(zoom, zoom), colorspace=pymupdf.csGRAY
+            )
+            img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        return ImageOps.autocontrast(img)
+    except Exception:
+        return None
+
+
+def _render_first_page(pdf_path: Path, dpi: int):
+    """
+    PyMuPDF rasterizes in-process and already grayscale; pdf2image (poppler
+    subprocess) is the fallback.
+    """
+    img = _render_pymupdf(pdf_path, dpi)
+    if img is not None:
+        return img
+
     try:
         from pdf2image import convert_from_path
-        from PIL import ImageOps
     except Exception:
-        return ""
+        return None
 
     try:
         images = convert_from_path(str(pdf_path), first_page=1, last_page=1, dpi=dpi)
-        if not images:
-            return ""
-        img = images[0]
-        img = ImageOps.grayscale(img)
-        img = ImageOps.autocontrast(img)
-        return _ocr_image(img)
+        return _prep(images[0]) if images else None
     except Exception:
-        return ""
+        return None
+
+
+def _ocr_first_page(pdf_path: Path, dpi: int = 320) -> str:
+    img = _render_first_page(pdf_path, dpi=dpi)
+    return _ocr_image(img) if img is not None else ""
+
+
+def _ocr_fields(pdf_path: Path) -> Optional[Tuple[Dict, str]]:
+    """One full-page OCR -> (fields, normalized text), or None if OCR read nothing."""
+    txt = _ocr_first_page(pdf_path)
+    return _scan_ocr(txt) if txt.strip() else None
 
 
 # -----------------------------
@@ -93,6 +235,15 @@ _OCR_DIGIT_FIX = str.maketrans(
         "G": "6",
     }
 )
+_NOT_IBAN_CHAR_RE = re.compile(r"[^0-9TR]")
+# TR + 24 digit-ish chars (digits or their upper-case OCR look-alikes), optionally
+# grouped by single spaces; the digit fix is then applied to the match only
+_IBAN_OCR_RE = re.compile(r"TR((?: ?[0-9ODI|SBZG]){24})")
+_IBAN_RE = re.compile(r"TR(\d{24})")
+
+
+def _ocr_compact(up: str) -> str:
+    return _NOT_IBAN_CHAR_RE.sub("", up.translate(_OCR_DIGIT_FIX))
 
 
 def _iban_from_text(raw: str) -> Optional[str]:
@@ -102,41 +253,53 @@ def _iban_from_text(raw: str) -> Optional[str]:
 
     up = raw.upper()
 
-    i = up.find("TR")
-    window = up[i : i + 140] if i != -1 else up
-
-    window = window.translate(_OCR_DIGIT_FIX)
-    window = re.sub(r"[^0-9TR]", "", window)
+    # fast path: a well-formed (possibly OCR-garbled) IBAN; no buffer-wide translate
+    m = _IBAN_OCR_RE.search(up)
+    if m:
+        digits = m.group(1).replace(" ", "").translate(_OCR_DIGIT_FIX)
+        if digits.isdigit():
+            return "TR" + digits
 
-    m = re.search(r"TR(\d{24})", window)
+    # window after the first "TR" first; the whole text (where e.g. "TARIH 12..."
+    # can compact to "TR12...") only as a fallback
+    i = up.find("TR")
+    if i == -1:
+        m = _IBAN_RE.search(_ocr_compact(up))
+        return "TR" + m.group(1) if m else None
+
+    # _ocr_compact works per char, so the full text is head + window + tail and
+    # the window is only compacted once
+    window = _ocr_compact(up[i : i + 140])
+    m = _IBAN_RE.search(window)
     if m:
         return "TR" + m.group(1)
 
-    all_fixed = up.translate(_OCR_DIGIT_FIX)
-    all_fixed = re.sub(r"[^0-9TR]", "", all_fixed)
-    m2 = re.search(r"TR(\d{24})", all_fixed)
+    m2 = _IBAN_RE.search(_ocr_compact(up[:i]) + window + _ocr_compact(up[i + 140 :]))
     if m2:
         return "TR" + m2.group(1)
 
     return None
 
 
+_NAME_LEAD_JUNK_RE = re.compile(r"^[^A-Za-zÇĞİÖŞÜçğıöşü]+")
+_NAME_GLUED_LABEL_RE = re.compile(
+    r"\b(IBAN|Iban|Tutar|Dekont|Sorgu|Islem|İşlem|Vale|Val[oö]r)\b"
+)
+_NAME_BAD_CHARS_RE = re.compile(r"[^A-Za-zÇĞİÖŞÜçğıöşü'.\- ]+")
+
+
 def _clean_name_value(v: str) -> Optional[str]:
     if not v:
         return None
     v = v.strip()
 
     # remove leading OCR junk like "zAhmet" -> "Ahmet"
-    v = re.sub(r"^[^A-Za-zÇĞİÖŞÜçğıöşü]+", "", v)
+    v = _NAME_LEAD_JUNK_RE.sub("", v)
 
     # remove anything after glued labels
-    v = re.split(
-        r"\b(IBAN|Iban|Tutar|Dekont|Sorgu|Islem|İşlem|Vale|Val[oö]r)\b",
-        v,
-        maxsplit=1,
-    )[0]
+    v = _NAME_GLUED_LABEL_RE.split(v, maxsplit=1)[0]
 
-    v = re.sub(r"[^A-Za-zÇĞİÖŞÜçğıöşü'.\- ]+", " ", v)
+    v = _NAME_BAD_CHARS_RE.sub(" ", v)
     v = _clean(v)
 
     if not v:
@@ -150,6 +313,40 @@ def _clean_name_value(v: str) -> Optional[str]:
     return None
 
 
+_RECEIVER_LINE_RE = re.compile(
+    r"(?i)^\s*(?:4|A)lic[ıi1]\s+A\w{1,5}\s*[:=\-]\s*([^\n]{2,120})\s*$"
+)
+_RECEIVER_LINE_STD_RE = re.compile(
+    r"(?i)^\s*(?:4|A)lic[ıi1]\s+Ad[ıi1]?\w{0,3}\s*[:=\-]?\s*([^\n]{2,120})\s*$"
+)
+# lines starting with the label; only these go through the two line patterns
+_RECEIVER_CAND_RE = re.compile(r"(?im)^[^\S\n]*(?:4|A)lic[ıi1][^\n]*")
+_RECEIVER_LABEL_RE = re.compile(r"(?i)(?:4|A)lic[ıi1]")
+_RECEIVER_ANY_RE = re.compile(r"(?i)(?:4|A)lic[ıi1]\s+A\w{1,5}\s*[:=\-]\s*([^\n]{2,120})")
+
+
+def _at_line_start(raw: str, p: int) -> bool:
+    """Only whitespace between the previous newline (or text start) and p."""
+    k = raw.rfind("\n", 0, p) + 1
+    return k == p or raw[k:p].isspace()
+
+
+def _match_at_label(label_re: re.Pattern, field_re: re.Pattern, raw: str):
+    """
+    Same result as the old "line start, optional whitespace, field_re" search:
+    walk the label hits, keep those that start a line, and match the field
+    pattern right there. Saves the engine trying the anchor alternation at
+    every position of the text.
+    """
+    for hit in label_re.finditer(raw):
+        p = hit.start()
+        if _at_line_start(raw, p):
+            m = field_re.match(raw, p)
+            if m:
+                return m
+    return None
+
+
 def _extract_receiver_name(raw: str) -> Optional[str]:
     """
     OCR in tr22.pdf shows:
@@ -157,148 +354,198 @@ def _extract_receiver_name(raw: str) -> Optional[str]:
     (1 instead of i, and Ach instead of Adi)
 
     Strategy:
-      - scan lines
+      - find lines starting with the label (one regex scan, not a Python loop
+        over every line)
       - match label like: (Alici/Alic1/4lici) + (A... short token) + ':' + value
       - clean the value
     """
     if not raw:
         return None
 
-    for ln in raw.splitlines():
-        line = ln.strip()
-        if not line:
-            continue
+    # splitlines() boundaries (\r, \f, \u2028, ...) -> "\n" so ^/$ see the same lines
+    for c in _RECEIVER_CAND_RE.finditer("\n".join(raw.splitlines())):
+        line = c.group(0).strip()
 
         # Example match: "Alic1 Ach :Ahmet Yaprak"
-        m = re.search(
-            r"(?i)^\s*(?:4|A)lic[ıi1]\s+A\w{1,5}\s*[:=\-]\s*([^\n]{2,120})\s*$",
-            line,
-        )
+        m = _RECEIVER_LINE_RE.search(line)
         if m:
             v = _clean_name_value(m.group(1))
             if v:
                 return v
 
         # More standard cases:
-        m2 = re.search(
-            r"(?i)^\s*(?:4|A)lic[ıi1]\s+Ad[ıi1]?\w{0,3}\s*[:=\-]?\s*([^\n]{2,120})\s*$",
-            line,
-        )
+        m2 = _RECEIVER_LINE_STD_RE.search(line)
         if m2:
             v = _clean_name_value(m2.group(1))
             if v:
                 return v
 
     # fallback: try whole raw (in case OCR collapsed lines)
-    m3 = re.search(
-        r"(?i)(?:^|\n)\s*(?:4|A)lic[ıi1]\s+A\w{1,5}\s*[:=\-]\s*([^\n]{2,120})",
-        raw,
-    )
+    m3 = _match_at_label(_RECEIVER_LABEL_RE, _RECEIVER_ANY_RE, raw)
     if m3:
         return _clean_name_value(m3.group(1))
 
     return None
 
 
-def _extract_amount(raw: str) -> Optional[str]:
-    m = re.search(
-        r"(?:^|\n)\s*Tutar\s*[:\-]?\s*([0-9]{1,3}(?:[.\s][0-9]{3})*(?:[,\.][0-9]{2}))\s*(TRY|TL)\b",
-        raw,
-        flags=re.IGNORECASE,
-    )
+_TUTAR_RE = re.compile(r"Tutar", re.IGNORECASE)
+_AMOUNT_LABEL_RE = re.compile(
+    r"Tutar\s*[:\-]?\s*([0-9]{1,3}(?:[.\s][0-9]{3})*(?:[,\.][0-9]{2}))\s*(TRY|TL)\b",
+    re.IGNORECASE,
+)
+_AMOUNT_CAND_RE = re.compile(r"\b\d{1,3}(?:[.\s]\d{3})*(?:[,\.]\d{2})\b")
+
+
+def _amount_value(s: str) -> float:
+    """Candidate from _AMOUNT_CAND_RE (already digits + separators only) -> float."""
+    s = s.replace(" ", "")
+    if "." in s and "," in s:
+        s = s.replace(".", "").replace(",", ".")
+    else:
+        s = s.replace(",", ".")
+    try:
+        return float(s)
+    except ValueError:  # e.g. "1.234.56"
+        return 0.0
+
+
+def _extract_amount(raw: str, labeled: bool = True) -> Optional[str]:
+    m = _match_at_label(_TUTAR_RE, _AMOUNT_LABEL_RE, raw) if labeled else None
     if m:
         num = m.group(1).replace(" ", "")
         cur = m.group(2).upper().replace("TRY", "TL")
         return f"{num} {cur}"
 
-    cands = re.findall(r"\b\d{1,3}(?:[.\s]\d{3})*(?:[,\.]\d{2})\b", raw)
+    cands = _AMOUNT_CAND_RE.findall(raw)
     if not cands:
         return None
 
-    def to_float(s: str) -> float:
-        s = s.replace(" ", "")
-        if "." in s and "," in s:
-            s = s.replace(".", "").replace(",", ".")
-        else:
-            s = s.replace(",", ".")
-        try:
-            return float(s)
-        except Exception:
-            return 0.0
-
-    best = max(cands, key=to_float)
+    best = max(cands, key=_amount_value)
     return f"{best.replace(' ', '')} TL"
 
 
-def _extract_time(raw: str) -> Optional[str]:
-    for lab in ["İŞLEM TARİHİ", "ISLEM TARIHI", "DUZENLEME TARIHI", "DÜZENLEME TARIHI"]:
-        m = re.search(
-            rf"(?:^|\n)\s*{lab}\s*[:=\-]?\s*(\d{{2}}[./-]\d{{2}}[./-]\d{{4}}\s+\d{{2}}:\d{{2}}:\d{{2}})",
-            raw,
-            flags=re.IGNORECASE,
-        )
+_TIME_LABEL_RES = [
+    (
+        re.compile(lab, re.IGNORECASE),
+        re.compile(
+            rf"{lab}\s*[:=\-]?\s*(\d{{2}}[./-]\d{{2}}[./-]\d{{4}}\s+\d{{2}}:\d{{2}}:\d{{2}})",
+            re.IGNORECASE,
+        ),
+    )
+    for lab in ["İŞLEM TARİHİ", "ISLEM TARIHI", "DUZENLEME TARIHI", "DÜZENLEME TARIHI"]
+]
+_DATETIME_RE = re.compile(r"\b(\d{2}[./-]\d{2}[./-]\d{4})\s+(\d{2}:\d{2}:\d{2})\b")
+
+
+def _extract_time(raw: str, labeled: bool = True) -> Optional[str]:
+    for label_re, rx in _TIME_LABEL_RES if labeled else ():
+        m = _match_at_label(label_re, rx, raw)
         if m:
             v = m.group(1).replace("/", ".").replace("-", ".")
             return _clean(v)
 
-    m2 = re.search(r"\b(\d{2}[./-]\d{2}[./-]\d{4})\s+(\d{2}:\d{2}:\d{2})\b", raw)
+    m2 = _DATETIME_RE.search(raw)
     if m2:
         d = m2.group(1).replace("/", ".").replace("-", ".")
         return f"{d} {m2.group(2)}"
     return None
 
 
+_DEKONT_LABEL_RE = re.compile(r"DEKONT", re.IGNORECASE)
+_DEKONT_FIS_RE = re.compile(
+    r"DEKONT\s*NO\s*/\s*FIS\s*NO\s*[:=\-]?\s*([0-9]{3,20}(?:/[0-9]{2,20})?)",
+    re.IGNORECASE,
+)
+_DEKONT_RE = re.compile(
+    r"DEKONT\s*NO[^0-9]*([0-9]{3,20}(?:/[0-9]{2,20})?)",
+    re.IGNORECASE,
+)
+
+
 def _extract_receipt_no(raw: str) -> Optional[str]:
-    m = re.search(
-        r"(?:^|\n)\s*DEKONT\s*NO\s*/\s*FIS\s*NO\s*[:=\-]?\s*([0-9]{3,20}(?:/[0-9]{2,20})?)",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    m = _match_at_label(_DEKONT_LABEL_RE, _DEKONT_FIS_RE, raw)
     if m:
         return _clean(m.group(1))
 
-    m2 = re.search(
-        r"(?:^|\n)\s*DEKONT\s*NO[^0-9]*([0-9]{3,20}(?:/[0-9]{2,20})?)",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    m2 = _match_at_label(_DEKONT_LABEL_RE, _DEKONT_RE, raw)
     return _clean(m2.group(1)) if m2 else None
 
 
-def _extract_tx_ref(raw: str) -> Optional[str]:
-    m = re.search(
-        r"(?:^|\n)\s*Sorgu\s*Numarasi\s*[:=\-]?\s*([0-9]{6,12})\b",
-        raw,
-        flags=re.IGNORECASE,
-    )
+_SORGU_LABEL_RE = re.compile(r"Sorgu", re.IGNORECASE)
+_SORGU_RE = re.compile(
+    r"Sorgu\s*Numarasi\s*[:=\-]?\s*([0-9]{6,12})\b",
+    re.IGNORECASE,
+)
+_EIGHT_DIGITS_RE = re.compile(r"\b\d{8}\b")
+
+
+def _extract_tx_ref(
+    raw: str, norm: Optional[str] = None, labeled: bool = True
+) -> Optional[str]:
+    m = _match_at_label(_SORGU_LABEL_RE, _SORGU_RE, raw) if labeled else None
     if m:
         return _clean(m.group(1))
 
-    n = _norm(raw)
+    n = norm if norm is not None else _norm(raw)
     j = n.find("sorgu")
     window = n[j : j + 220] if j != -1 else n
-    nums = re.findall(r"\b\d{8}\b", window)
+    nums = _EIGHT_DIGITS_RE.findall(window)
     return nums[0] if nums else None
 
 
-def parse_ziraatkatilim(pdf_path: Path) -> Dict:
-    raw = _extract_text_layer(pdf_path, max_pages=1)
-    if not raw.strip():
-        raw = _ocr_first_page(pdf_path)
+def _scan_fields(raw: str, n: str) -> Dict:
+    """
+    Run the field extractors, skipping every label regex whose label can't be
+    in the text. The probes are plain substring tests on the normalized text
+    (every char re.I folds onto a label letter normalizes to that letter), so
+    results match the ungated extractors.
+    """
+    return {
+        "receiver_name": _extract_receiver_name(raw) if "lic" in n else None,
+        "receiver_iban": _iban_from_text(raw),
+        "amount": _extract_amount(raw, labeled="tutar" in n),
+        "transaction_time": _extract_time(raw, labeled="tar" in n),
+        "receipt_no": _extract_receipt_no(raw) if "dekont" in n else None,
+        "transaction_ref": _extract_tx_ref(raw, n, labeled="sorgu" in n),
+    }
 
-    raw = raw or ""
 
-    receiver_name = _extract_receiver_name(raw)
-    receiver_iban = _iban_from_text(raw)
-    amount = _extract_amount(raw)
-    transaction_time = _extract_time(raw)
-    receipt_no = _extract_receipt_no(raw)
-    transaction_ref = _extract_tx_ref(raw)
+def _tr_status(n: str) -> str:
+    return "completed" if ("dekont" in n or "fast" in n) else "unknown"
+
+
+def _scan_ocr(txt: str) -> Tuple[Dict, str]:
+    n = _norm(txt)
+    return _scan_fields(txt, n), n
 
-    sender_name = None  # masked in this template; don't guess
 
+# any of these in the text layer means it carries the fields -> no OCR needed
+_KEY_LABELS = ("alici", "tutar", "sorgu", "dekont")
+
+
+def parse_ziraatkatilim(pdf_path: Path) -> Dict:
+    raw = _extract_text_layer(pdf_path, max_pages=1) or ""
     n = _norm(raw)
-    tr_status = "completed" if ("dekont" in n or "fast" in n) else "unknown"
+
+    fields = None
+    # a stray glyph (page number, logo text) isn't a text layer worth parsing
+    if not any(k in n for k in _KEY_LABELS):
+        ocr = _ocr_fields(pdf_path)
+        if ocr is not None:
+            fields, n = ocr
+
+    if fields is None:
+        fields = _scan_fields(raw, n)
+    receiver_name = fields["receiver_name"]
+    receiver_iban = fields["receiver_iban"]
+    amount = fields["amount"]
+    transaction_time = fields["transaction_time"]
+    receipt_no = fields["receipt_no"]
+    transaction_ref = fields["transaction_ref"]
+
+    sender_name = None  # masked in this template; don't guess
+
+    tr_status = _tr_status(n)
 
     return {
         "tr_status": "FUCK ZIRAAT KATILIM ",
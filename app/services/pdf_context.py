@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -9,6 +13,30 @@ from pypdf import PdfReader
 
 from app.detectors.text_layer import normalize_text
 
+log = logging.getLogger("pdf-checker")
+
+# Cross-request text cache keyed by file content, so a re-uploaded / retried PDF
+# skips the pypdf parse. Values are [text_raw, text_norm]; norm is filled lazily.
+_TEXT_CACHE_MAX = 64
+_TEXT_CACHE: "OrderedDict[tuple[bytes, int], list[Optional[str]]]" = OrderedDict()
+_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: tuple[bytes, int]) -> Optional[list[Optional[str]]]:
+    with _TEXT_CACHE_LOCK:
+        entry = _TEXT_CACHE.get(key)
+        if entry is not None:
+            _TEXT_CACHE.move_to_end(key)
+        return entry
+
+
+def _cache_put(key: tuple[bytes, int], entry: list[Optional[str]]) -> None:
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE[key] = entry
+        _TEXT_CACHE.move_to_end(key)
+        while len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+
 
 @dataclass
 class PDFContext:
@@ -30,9 +58,14 @@ class PDFContext:
     _reader_attempted: bool = False
     _text_raw: Optional[str] = None
     _text_norm: Optional[str] = None
+    _sha256: Optional[bytes] = None
+    _cache_key: Optional[tuple[bytes, int]] = None
 
     @property
     def pdf_bytes(self) -> bytes:
+        # Plain bytes, not mmap: read_bytes() sizes its one read from fstat,
+        # BytesIO(bytes) shares the buffer instead of copying it, and pdf_meta
+        # needs bytes methods (.count) that mmap lacks.
         if self._pdf_bytes is None:
             self._pdf_bytes = self.path.read_bytes()
         return self._pdf_bytes
@@ -44,17 +77,12 @@ class PDFContext:
 
         self._reader_attempted = True
 
-        # Prefer BytesIO so we reuse cached bytes and avoid holding a file handle open.
+        # Always parse from the cached bytes: re-opening by path would only read the
+        # same bytes from disk again, and pypdf treats both sources identically.
         try:
             self._reader = PdfReader(io.BytesIO(self.pdf_bytes))
-            return self._reader
-        except Exception:
-            pass
-
-        # Fallback: some edge-case PDFs behave better opened from a path.
-        try:
-            self._reader = PdfReader(str(self.path))
-        except Exception:
+        except Exception as e:
+            log.warning("PdfReader failed for %s: %s: %s", self.display_name, type(e).__name__, e)
             self._reader = None
 
         return self._reader
@@ -66,20 +94,56 @@ class PDFContext:
 
         try:
             parts: list[str] = []
-            for page in r.pages[:max_pages]:
+            for i in range(min(max_pages, len(r.pages))):
+                page = r.pages[i]
+                # no content stream -> no text; don't spin up the extractor
+                if "/Contents" not in page:
+                    parts.append("")
+                    continue
                 parts.append(page.extract_text() or "")
             return "\n".join(parts)
         except Exception:
             return ""
 
+    @property
+    def sha256(self) -> Optional[str]:
+        """Hex SHA256 of the file, hashed once: keys the text cache and the metadata report."""
+        if self._sha256 is None:
+            try:
+                self._sha256 = hashlib.sha256(self.pdf_bytes).digest()
+            except OSError:
+                return None  # unreadable file: no caching, reader reports the failure
+        return self._sha256.hex()
+
+    @property
+    def cache_key(self) -> Optional[tuple[bytes, int]]:
+        if self._cache_key is None:
+            if self.sha256 is None:
+                return None
+            self._cache_key = (self._sha256, self.max_pages_text)
+        return self._cache_key
+
     @property
     def text_raw(self) -> str:
         if self._text_raw is None:
-            self._text_raw = self._extract_text_from_reader(self.max_pages_text)
+            key = self.cache_key
+            entry = _cache_get(key) if key is not None else None
+            if entry is None:
+                entry = [self._extract_text_from_reader(self.max_pages_text), None]
+                if key is not None:
+                    _cache_put(key, entry)
+            self._text_raw = entry[0]
         return self._text_raw
 
     @property
     def text_norm(self) -> str:
         if self._text_norm is None:
-            self._text_norm = normalize_text(self.text_raw)
+            key = self.cache_key
+            entry = _cache_get(key) if key is not None else None
+            if entry is not None and entry[1] is not None:
+                self._text_norm = entry[1]
+            else:
+                self._text_norm = normalize_text(self.text_raw)
+                if entry is not None:
+                    entry[1] = self._text_norm
         return self._text_norm
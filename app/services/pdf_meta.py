@@ -3,9 +3,11 @@ import io
 import re
 import shutil
 import subprocess
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from pypdf import PdfReader
 
@@ -30,13 +32,18 @@ def _safe_stat_time(ts: float) -> str:
         return ""
 
 
+_HEADER_RE = re.compile(rb"%PDF-(\d\.\d)")
+
+
 def _pdf_header_version(pdf_bytes: bytes) -> str:
-    m = re.match(rb"%PDF-(\d\.\d)", pdf_bytes[:16])
+    # anchored, fixed-length pattern: no need to slice off the first 16 bytes
+    m = _HEADER_RE.match(pdf_bytes)
     return m.group(1).decode("ascii", errors="ignore") if m else ""
 
 
 def _detect_linearized(pdf_bytes: bytes) -> bool:
-    return b"/Linearized" in pdf_bytes[:4096]
+    # bounded find instead of `in pdf_bytes[:4096]`: same window, no slice copy
+    return pdf_bytes.find(b"/Linearized", 0, 4096) != -1
 
 
 def _detect_signatures(pdf_bytes: bytes) -> bool:
@@ -49,23 +56,43 @@ def _count_startxref(pdf_bytes: bytes) -> int:
     return pdf_bytes.count(b"startxref")
 
 
+_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)\s+%%EOF", re.S)
+_OBJ_RE = re.compile(rb"\n\d+\s+\d+\s+obj\b")
+
+
+# the trailer (startxref ... %%EOF) is normally within the last few KB
+_TAIL_WINDOW = 64 * 1024
+
+
 def _startxref_value(pdf_bytes: bytes) -> str:
-    # last startxref value in file
-    m = re.findall(rb"startxref\s+(\d+)\s+%%EOF", pdf_bytes, flags=re.S)
-    if not m:
-        return ""
-    try:
-        return m[-1].decode("ascii", errors="ignore")
-    except Exception:
-        return ""
+    # last startxref value in file: walk back from the last "startxref", looking
+    # in the tail window first and only then in the rest of the file
+    n = len(pdf_bytes)
+    lo = max(0, n - _TAIL_WINDOW)
+    # second range ends so a "startxref" straddling `lo` is still found
+    for start, end in ((lo, n), (0, lo + len(b"startxref") - 1)):
+        i = pdf_bytes.rfind(b"startxref", start, end)
+        while i != -1:
+            m = _STARTXREF_RE.match(pdf_bytes, i)
+            if m:
+                return m.group(1).decode("ascii", errors="ignore")
+            i = pdf_bytes.rfind(b"startxref", start, i)
+    return ""
 
 
 def _count_eof(pdf_bytes: bytes) -> int:
-    return pdf_bytes.count(b"%%EOF")
+    # %%EOF only counts on its own line: a bare count also hit the marker inside
+    # comments or stream data. Still whole-file: every incremental update appends
+    # its own %%EOF, and those are what this count is for.
+    return (
+        pdf_bytes.count(b"\n%%EOF")
+        + pdf_bytes.count(b"\r%%EOF")
+        + pdf_bytes.startswith(b"%%EOF")
+    )
 
 
 def _estimate_obj_count(pdf_bytes: bytes) -> int:
-    return len(re.findall(rb"\n\d+\s+\d+\s+obj\b", pdf_bytes))
+    return sum(1 for _ in _OBJ_RE.finditer(pdf_bytes))
 
 
 def _sha256(b: bytes) -> str:
@@ -73,9 +100,26 @@ def _sha256(b: bytes) -> str:
 
 
 def _md5(b: bytes) -> str:
+    # legacy fingerprint, kept because people compare it against other tools
     return hashlib.md5(b).hexdigest()
 
 
+def _file_hashes(pdf_bytes: bytes, sha256: Optional[str] = None) -> Dict[str, str]:
+    mv = memoryview(pdf_bytes)  # 1KB head/tail slices without copying
+
+    # a caller that already hashed the bytes (PDFContext) saves a full pass
+    if sha256 is None:
+        sha256 = _sha256(mv)
+    md5 = _md5(mv)
+
+    return {
+        "sha256": sha256,
+        "md5": md5,
+        "first1k_sha256": _sha256(mv[:1024]),
+        "last1k_sha256": _sha256(mv[-1024:]) if len(mv) >= 1024 else sha256,
+    }
+
+
 # -------------------------
 # Python Meta (fingerprints)
 # -------------------------
@@ -86,18 +130,22 @@ def _format_python_meta(
     display_name: str,
     pdf_bytes: Optional[bytes] = None,
     reader: Optional[PdfReader] = None,
+    hashes: Optional[Dict[str, str]] = None,
+    fingerprint_page0: bool = True,
 ) -> str:
     if pdf_bytes is None:
+        # read once; /check passes PDFContext's bytes, so this is only for direct callers.
+        # Not mmap: mmap has no .count() and its `in` tests single bytes, not
+        # substrings, so every heuristic below would need rewriting around it.
         pdf_bytes = pdf_path.read_bytes()
     st = pdf_path.stat()
 
-    sha256 = _sha256(pdf_bytes)
-    md5 = _md5(pdf_bytes)
-
-    first1k_sha256 = _sha256(pdf_bytes[:1024])
-    last1k_sha256 = (
-        _sha256(pdf_bytes[-1024:]) if len(pdf_bytes) >= 1024 else _sha256(pdf_bytes)
-    )
+    if hashes is None:
+        hashes = _file_hashes(pdf_bytes)
+    sha256 = hashes["sha256"]
+    md5 = hashes["md5"]
+    first1k_sha256 = hashes["first1k_sha256"]
+    last1k_sha256 = hashes["last1k_sha256"]
 
     pdf_ver = _pdf_header_version(pdf_bytes)
     is_linearized = _detect_linearized(pdf_bytes)
@@ -107,10 +155,9 @@ def _format_python_meta(
     eof_count = _count_eof(pdf_bytes)
     obj_est = _estimate_obj_count(pdf_bytes)
     if reader is None:
-        try:
-            reader = PdfReader(io.BytesIO(pdf_bytes))
-        except Exception:
-            reader = PdfReader(str(pdf_path))
+        # BytesIO shares the buffer; re-opening by path on failure would only read
+        # the same bytes from disk a second time and fail the same way
+        reader = PdfReader(io.BytesIO(pdf_bytes))
     pages = len(reader.pages)
     encrypted = bool(getattr(reader, "is_encrypted", False))
 
@@ -141,10 +188,14 @@ def _format_python_meta(
     try:
         p0 = reader.pages[0]
 
-        c = p0.get_contents()
-        if c is not None:
-            data = c.get_data()
-            page0_content_sha256 = hashlib.sha256(data).hexdigest()
+        # the content hash means inflating page 0's streams; callers may skip it
+        if not fingerprint_page0:
+            page0_content_sha256 = "(skipped)"
+        else:
+            c = p0.get_contents()
+            if c is not None:
+                data = c.get_data()
+                page0_content_sha256 = hashlib.sha256(data).hexdigest()
 
         res = p0.get("/Resources") or {}
         fonts = res.get("/Font") or {}
@@ -243,54 +294,76 @@ def _format_python_meta(
 # -------------------------
 
 
+# The version can't change while the server runs, so ask each executable once
+# instead of starting another perl process per upload.
+_EXIFTOOL_VERSIONS: Dict[str, str] = {}
+# the -a -G0:1 report already carries the version as its first tag
+_EXIF_VER_RE = re.compile(r"^\[ExifTool\]\s*ExifToolVersion\s*:\s*(\S+)", re.M)
+
+
 def _exiftool_version(exe: str) -> str:
+    v = _EXIFTOOL_VERSIONS.get(exe)
+    if v is not None:
+        return v
     try:
         p = subprocess.run([exe, "-ver"], capture_output=True, text=True, timeout=6)
         v = (p.stdout or "").strip()
-        return v
     except Exception:
         return ""
+    if v:
+        _EXIFTOOL_VERSIONS[exe] = v
+    return v
+
+
+def _exiftool_version_from(raw: str, exe: str) -> str:
+    m = _EXIF_VER_RE.search(raw)
+    if m:
+        return m.group(1)
+    return _exiftool_version(exe)
+
+
+# one finditer over the whole report instead of splitlines() + a match per line;
+# [^\S\n] keeps the gaps on one line, \r? drops a CRLF ending like splitlines did
+_EXIF_LINE_RE = re.compile(
+    r"^\[(.+?)\][^\S\n]*(.+?)[^\S\n]*:[^\S\n]*(.*?)\r?$", re.M
+)
 
 
 def _format_exiftool_grouped(raw: str, display_name: str, exif_ver: str) -> str:
     # raw lines: [System] FileName : something
     groups: Dict[str, list[str]] = {}
-    order: list[str] = []
-
-    for line in raw.splitlines():
-        line = line.rstrip("\n")
-        m = re.match(r"^\[(.+?)\]\s*(.+?)\s*:\s*(.*)$", line)
-        if not m:
-            continue
 
+    for m in _EXIF_LINE_RE.finditer(raw):
         g = m.group(1).strip()
         tag = m.group(2).strip()
         val = m.group(3)
 
-        # keep user filename for templates
-        if g.lower() == "system" and tag.lower() in ("filename", "file name"):
+        # keep user filename for templates (-G0:1 names the group "File:System")
+        if g.lower() in ("system", "file:system") and tag.lower() in ("filename", "file name"):
             val = display_name
 
-        if g not in groups:
-            groups[g] = []
-            order.append(g)
-
-        groups[g].append(f"{tag:28}: {val}")
+        # dicts keep insertion order, so groups come out in first-seen order
+        groups.setdefault(g, []).append(f"{tag:28}: {val}")
 
     out = []
     out.append("---- ExifTool ----")
     out.append(f"ExifTool Version              : {exif_ver or '(unknown)'}")
     out.append("")
 
-    for g in order:
+    for g, rows in groups.items():
         out.append(f"---- {g} ----")
-        out.extend(groups[g])
+        out.extend(rows)
         out.append("")
 
     return "\n".join(out).strip()
 
 
-def _run_exiftool(pdf_path: Path, display_name: str) -> str:
+def _run_exiftool_raw(pdf_path: Path, system_only: bool = False) -> Tuple[Optional[str], str]:
+    """
+    (raw -a -G0:1 report, ExifTool version), or (None, message) on failure.
+    system_only: just the File:System group (-fast4: the file isn't even opened),
+    and no version.
+    """
     # Priority:
     # 1) bundled repo exiftool (perl script) via bin/exiftool/run_exiftool.sh
     # 2) system exiftool if available
@@ -298,61 +371,85 @@ def _run_exiftool(pdf_path: Path, display_name: str) -> str:
         Path(__file__).resolve().parents[2] / "bin" / "exiftool" / "run_exiftool.sh"
     )
     if bundled.exists():
-        try:
-            proc = subprocess.run(
-                [str(bundled), "-a", "-G0:1", "-s", "-sort", str(pdf_path)],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-            raw = proc.stdout or ""
-            if not raw.strip():
-                err = (proc.stderr or "").strip()
-                return f"ExifTool returned no output. {('ERR: ' + err) if err else ''}".strip()
-
-            # version
-            try:
-                pv = subprocess.run(
-                    [str(bundled), "-ver"], capture_output=True, text=True, timeout=6
-                )
-                ver = (pv.stdout or "").strip()
-            except Exception:
-                ver = ""
-
-            return _format_exiftool_grouped(
-                raw, display_name=display_name, exif_ver=ver
-            )
-
-        except subprocess.TimeoutExpired:
-            return "ExifTool timed out."
-        except Exception as e:
-            return f"ExifTool failed: {type(e).__name__}: {e}"
-
-    exe = shutil.which("exiftool")
-    if not exe:
-        return "ExifTool not available on server (not installed and no bundled exiftool found)."
+        exe, timeout = str(bundled), 15
+    else:
+        exe, timeout = shutil.which("exiftool"), 12
+        if not exe:
+            return None, "ExifTool not available on server (not installed and no bundled exiftool found)."
 
     try:
+        args = ["-fast4", "-File:System:all"] if system_only else []
         proc = subprocess.run(
-            [exe, "-a", "-G0:1", "-s", "-sort", str(pdf_path)],
+            [exe, "-a", "-G0:1", "-s", "-sort", *args, str(pdf_path)],
             capture_output=True,
             text=True,
-            timeout=12,
+            timeout=timeout,
         )
         raw = proc.stdout or ""
         if not raw.strip():
             err = (proc.stderr or "").strip()
-            return (
-                f"ExifTool returned no output. {('ERR: ' + err) if err else ''}".strip()
-            )
+            return None, f"ExifTool returned no output. {('ERR: ' + err) if err else ''}".strip()
 
-        ver = _exiftool_version(exe)
-        return _format_exiftool_grouped(raw, display_name=display_name, exif_ver=ver)
+        if system_only:
+            return raw, ""
+        return raw, _exiftool_version_from(raw, exe)
 
     except subprocess.TimeoutExpired:
-        return "ExifTool timed out."
+        return None, "ExifTool timed out."
     except Exception as e:
-        return f"ExifTool failed: {type(e).__name__}: {e}"
+        return None, f"ExifTool failed: {type(e).__name__}: {e}"
+
+
+def _run_exiftool(pdf_path: Path, display_name: str) -> str:
+    raw, ver = _run_exiftool_raw(pdf_path)
+    if raw is None:
+        return ver
+    return _format_exiftool_grouped(raw, display_name=display_name, exif_ver=ver)
+
+
+# File:System is the one group that describes the stored file rather than the PDF
+# (directory, name, dates, permissions, size), so it is never cached.
+_EXIF_SYSTEM_LINE_RE = re.compile(r"^\[File:System\][^\n]*\n?", re.M)
+_EXIF_HEAD_RE = re.compile(r"(?:\[ExifTool\][^\n]*\n)*")
+
+
+# ExifTool is the slow part of /check, so its report is kept per file content.
+# Memory only, a few kB per entry; uploads are not written anywhere persistent.
+# Entries hold the raw report minus File:System: the same receipt uploaded again
+# only asks ExifTool for that group, which doesn't parse the PDF.
+_EXIF_CACHE_MAX = 128
+_EXIF_CACHE: "OrderedDict[str, tuple[str, str]]" = OrderedDict()
+_EXIF_CACHE_LOCK = threading.Lock()
+
+
+def _run_exiftool_cached(pdf_path: Path, display_name: str, sha256: Optional[str]) -> str:
+    if sha256 is None:
+        return _run_exiftool(pdf_path, display_name)
+
+    with _EXIF_CACHE_LOCK:
+        hit = _EXIF_CACHE.get(sha256)
+        if hit is not None:
+            _EXIF_CACHE.move_to_end(sha256)
+
+    if hit is not None:
+        rest, ver = hit
+        system, err = _run_exiftool_raw(pdf_path, system_only=True)
+        if system is None:
+            return err
+        head = _EXIF_HEAD_RE.match(rest).end()
+        raw = rest[:head] + system + rest[head:]
+    else:
+        raw, ver = _run_exiftool_raw(pdf_path)
+        # failures (timeouts, missing exiftool) are worth retrying next time
+        if raw is None:
+            return ver
+        with _EXIF_CACHE_LOCK:
+            _EXIF_CACHE[sha256] = (_EXIF_SYSTEM_LINE_RE.sub("", raw), ver)
+            _EXIF_CACHE.move_to_end(sha256)
+            while len(_EXIF_CACHE) > _EXIF_CACHE_MAX:
+                _EXIF_CACHE.popitem(last=False)
+
+    return _format_exiftool_grouped(raw, display_name=display_name, exif_ver=ver)
 
 
 # -------------------------
@@ -365,13 +462,50 @@ def extract_metadata_logs(
     display_name: Optional[str] = None,
     pdf_bytes: Optional[bytes] = None,
     pdf_reader: Optional[PdfReader] = None,
+    fingerprint_page0: bool = True,
+    sha256: Optional[str] = None,
 ) -> Dict[str, str]:
     name = display_name or pdf_path.name
 
+    hashes: Optional[Dict[str, str]] = None
+    err: Optional[Exception] = None
     try:
-        py = _format_python_meta(pdf_path, name, pdf_bytes=pdf_bytes, reader=pdf_reader)
+        if pdf_bytes is None:
+            pdf_bytes = pdf_path.read_bytes()
+        hashes = _file_hashes(pdf_bytes, sha256=sha256)
     except Exception as e:
-        py = f"PythonMeta failed: {type(e).__name__}: {e}"
+        err = e
+
+    py: Optional[str] = None
+
+    def python_pass() -> None:
+        nonlocal py
+        try:
+            py = _format_python_meta(
+                pdf_path,
+                name,
+                pdf_bytes=pdf_bytes,
+                reader=pdf_reader,
+                hashes=hashes,
+                fingerprint_page0=fingerprint_page0,
+            )
+        except Exception as e:
+            py = f"PythonMeta failed: {type(e).__name__}: {e}"
+
+    # ExifTool spends its time waiting on the subprocess, so the pypdf side of the
+    # report runs meanwhile on a short-lived thread: latency is max(py, exif), not
+    # the sum. ExifTool stays on the caller's thread, no shared pool to queue on.
+    helper = None
+    if err is None:
+        helper = threading.Thread(target=python_pass, name="pdf-meta-py", daemon=True)
+        helper.start()
+    else:
+        py = f"PythonMeta failed: {type(err).__name__}: {err}"
+
+    try:
+        ex = _run_exiftool_cached(pdf_path, name, hashes["sha256"] if hashes else None)
+    finally:
+        if helper is not None:
+            helper.join()
 
-    ex = _run_exiftool(pdf_path, name)
     return {"python": py, "exiftool": ex}
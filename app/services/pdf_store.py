@@ -1,11 +1,16 @@
+import heapq
+import os
+import re
 import secrets
 import shutil
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import HTTPException
+from fastapi import HTTPException, UploadFile
 
 
 PDF_STORE_DIR = Path(tempfile.gettempdir()) / "pdf_checker_store"
@@ -13,44 +18,180 @@ PDF_STORE_DIR.mkdir(parents=True, exist_ok=True)
 
 PDF_TTL_SECONDS = 60 * 30  # 30 minutes
 
+# In-memory TTL index, so a request doesn't glob + stat the whole store:
+# token -> (path, expires_at), plus a min-heap of (expires_at, token) for cleanup.
+# Each uvicorn worker has its own index; tokens stored by another worker are
+# found on disk on first use and indexed then, and a periodic sweep picks up the
+# rest (e.g. files of a worker that was restarted) so some worker expires them.
+_INDEX: Dict[str, Tuple[Path, float]] = {}
+_EXPIRY: List[Tuple[float, str]] = []
+_LOCK = threading.Lock()
 
-def cleanup_pdf_store(now: Optional[float] = None) -> None:
-    now_ts = now if now is not None else time.time()
+_DISK_SWEEP_SECONDS = 5 * 60
+_next_disk_sweep = 0.0
+
+# secrets.token_urlsafe(16): always 22 url-safe chars. Anything else can't be in
+# the store, so it is refused without touching the disk. Files are named
+# "<token>__<name>"; a token may itself contain "__", so split by length.
+_TOKEN_LEN = 22
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]{22}")
+
+# Well-formed tokens already looked up on disk and not found. Tokens are never
+# reused and a file is stored before its token is handed out, so a miss stays a
+# miss; bounded, so random tokens can't grow it without limit.
+_MISSING_MAX = 1024
+_MISSING: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _token_of(name: str) -> Optional[str]:
+    if name[_TOKEN_LEN : _TOKEN_LEN + 2] != "__":
+        return None
+    t = name[:_TOKEN_LEN]
+    return t if _TOKEN_RE.fullmatch(t) else None
+
+
+def _index_add(token: str, p: Path, expires_at: float) -> None:
+    with _LOCK:
+        _INDEX[token] = (p, expires_at)
+        heapq.heappush(_EXPIRY, (expires_at, token))
+
+
+def _index_from_disk() -> None:
+    # cold start / periodic sweep: pick up what is already stored
     try:
-        for p in PDF_STORE_DIR.glob("*__*"):
-            try:
-                if (now_ts - p.stat().st_mtime) > PDF_TTL_SECONDS:
-                    p.unlink(missing_ok=True)
-            except Exception:
-                pass
-    except Exception:
+        with os.scandir(PDF_STORE_DIR) as it:
+            for e in it:
+                t = _token_of(e.name)
+                if t is None:
+                    continue
+                try:
+                    expires_at = e.stat().st_mtime + PDF_TTL_SECONDS
+                except OSError:
+                    continue
+                with _LOCK:
+                    cur = _INDEX.get(t)
+                # several files for one token: keep the newest, as before
+                if cur is None or cur[1] < expires_at:
+                    _index_add(t, Path(e.path), expires_at)
+    except OSError:
         pass
 
 
-def store_pdf_for_view(src_path: Path, original_name: str) -> str:
-    cleanup_pdf_store()
+def _index_token_from_disk(token: str) -> None:
+    # a token stored by another worker: tokens are unique, so stop at the first
+    # match instead of letting glob list (and match) the rest of the store
+    with _LOCK:
+        if token in _MISSING:
+            return
+    prefix = f"{token}__"
+    try:
+        with os.scandir(PDF_STORE_DIR) as it:
+            for e in it:
+                if e.name.startswith(prefix):
+                    _index_add(token, Path(e.path), e.stat().st_mtime + PDF_TTL_SECONDS)
+                    return
+    except OSError:
+        return  # store unreadable: don't remember this as a miss
+    with _LOCK:
+        _MISSING[token] = None
+        while len(_MISSING) > _MISSING_MAX:
+            _MISSING.popitem(last=False)
+
+
+def cleanup_pdf_store(now: Optional[float] = None) -> None:
+    global _next_disk_sweep
+
+    now_ts = now if now is not None else time.time()
+    with _LOCK:
+        sweep = now_ts >= _next_disk_sweep
+        if sweep:
+            _next_disk_sweep = now_ts + _DISK_SWEEP_SECONDS
+    if sweep:
+        _index_from_disk()
+
+    expired: List[Path] = []
+    with _LOCK:
+        while _EXPIRY and _EXPIRY[0][0] < now_ts:
+            expires_at, token = heapq.heappop(_EXPIRY)
+            entry = _INDEX.get(token)
+            # stale heap item when a token was re-indexed with a later expiry
+            if entry is not None and entry[1] == expires_at:
+                del _INDEX[token]
+                expired.append(entry[0])
+    for p in expired:
+        try:
+            p.unlink(missing_ok=True)
+        except Exception:
+            pass
 
+
+def _new_store_path(original_name: str) -> Tuple[str, Path]:
     token = secrets.token_urlsafe(16)
     safe_name = (original_name or "file.pdf").replace("/", "_").replace("\\", "_")
-    dst = PDF_STORE_DIR / f"{token}__{safe_name}"
+    return token, PDF_STORE_DIR / f"{token}__{safe_name}"
+
 
+def store_upload_for_view(upload: UploadFile, original_name: str) -> Tuple[str, Path]:
+    """Write an upload straight to its store path, so /check reads and serves one file."""
+    cleanup_pdf_store()
+
+    token, dst = _new_store_path(original_name)
     try:
-        with src_path.open("rb") as r, dst.open("wb") as w:
-            shutil.copyfileobj(r, w)
+        upload.file.seek(0)
+        with dst.open("wb") as w:
+            # 1 MB chunks: a 20 MB receipt in ~20 read/write pairs instead of ~320
+            shutil.copyfileobj(upload.file, w, 1 << 20)
     except Exception as e:
+        dst.unlink(missing_ok=True)
         raise RuntimeError(f"Could not store PDF: {type(e).__name__}: {e}")
 
-    return token
+    _index_add(token, dst, time.time() + PDF_TTL_SECONDS)
+    return token, dst
+
+
+def discard_pdf(token: str) -> None:
+    """Drop a stored PDF before its TTL (e.g. the check that stored it failed)."""
+    with _LOCK:
+        entry = _INDEX.pop(token, None)
+    if entry is not None:
+        try:
+            entry[0].unlink(missing_ok=True)
+        except Exception:
+            pass
 
 
 def get_pdf_by_token(token: str) -> Tuple[Path, str]:
+    p, name, _st = get_pdf_with_stat(token)
+    return p, name
+
+
+def get_pdf_with_stat(token: str) -> Tuple[Path, str, os.stat_result]:
+    """Like get_pdf_by_token, plus the stat it already took (for FileResponse)."""
+    if not _TOKEN_RE.fullmatch(token):
+        raise HTTPException(status_code=404, detail="PDF not found (expired)")
+
+    with _LOCK:
+        known = token in _INDEX
+    if not known:
+        _index_token_from_disk(token)
+    # one pass, after any disk lookup: an on-disk file may already be past its TTL
     cleanup_pdf_store()
+    with _LOCK:
+        entry = _INDEX.get(token)
 
-    matches = list(PDF_STORE_DIR.glob(f"{token}__*"))
-    if not matches:
+    if entry is None:
         raise HTTPException(status_code=404, detail="PDF not found (expired)")
 
-    matches.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    p = matches[0]
-    name = p.name.split("__", 1)[1] if "__" in p.name else "file.pdf"
-    return p, name
+    p = entry[0]
+    try:
+        st = p.stat()
+    except OSError:
+        # another worker's cleanup may have removed the file already
+        raise HTTPException(status_code=404, detail="PDF not found (expired)")
+
+    name = p.name[_TOKEN_LEN + 2 :] or "file.pdf"
+    return p, name, st
+
+
+_next_disk_sweep = time.time() + _DISK_SWEEP_SECONDS
+_index_from_disk()
@@ -1,16 +1,22 @@
 import logging
+import time
 
 from fastapi import APIRouter, File, UploadFile
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from starlette.requests import Request
 
 from app.detectors.bank_detect import detect_bank_variant
 from app.parsers.registry import parse_by_key
 from app.services.pdf_context import PDFContext
 from app.services.pdf_meta import extract_metadata_logs
-from app.services.pdf_store import get_pdf_by_token, store_pdf_for_view
+from app.services.pdf_store import (
+    PDF_TTL_SECONDS,
+    discard_pdf,
+    get_pdf_by_token,
+    get_pdf_with_stat,
+    store_upload_for_view,
+)
 from app.services.pdf_view import build_pdf_wrapper_html
-from app.services.upload import save_upload_to_temp
 from app.web.templates import templates
 
 router = APIRouter()
@@ -29,39 +35,69 @@ def view_pdf(token: str):
     return HTMLResponse(content=html)
 
 
-@router.get("/pdf/{token}/raw")
-def view_pdf_raw(token: str):
-    p, name = get_pdf_by_token(token)
-    return FileResponse(
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-Match: "*" or a comma list of tags, compared weakly (W/ ignored)."""
+    if not if_none_match:
+        return False
+    ours = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == ours:
+            return True
+    return False
+
+
+def _pdf_file_response(request: Request, token: str, disposition: str) -> Response:
+    p, name, st = get_pdf_with_stat(token)
+    # the file behind a token never changes: let the browser keep it until the
+    # store expires it instead of revalidating on every view
+    max_age = max(0, int(st.st_mtime + PDF_TTL_SECONDS - time.time()))
+    cache_control = f"private, max-age={max_age}"
+    # pass our stat so FileResponse doesn't stat again for length / etag
+    resp = FileResponse(
         path=str(p),
         media_type="application/pdf",
         filename=name,
-        headers={"Content-Disposition": f'inline; filename="{name}"'},
+        stat_result=st,
+        headers={
+            "Content-Disposition": f'{disposition}; filename="{name}"',
+            "Cache-Control": cache_control,
+        },
     )
+    # a token's file never changes, so a matching ETag means the browser has it
+    etag = resp.headers.get("etag")
+    if etag and _etag_matches(etag, request.headers.get("if-none-match", "")):
+        return Response(
+            status_code=304, headers={"etag": etag, "cache-control": cache_control}
+        )
+    return resp
+
+
+@router.get("/pdf/{token}/raw")
+def view_pdf_raw(request: Request, token: str):
+    return _pdf_file_response(request, token, "inline")
 
 
 @router.get("/pdf/{token}/download")
-def download_pdf(token: str):
-    p, name = get_pdf_by_token(token)
-    return FileResponse(
-        path=str(p),
-        media_type="application/pdf",
-        filename=name,
-        headers={"Content-Disposition": f'attachment; filename="{name}"'},
-    )
+def download_pdf(request: Request, token: str):
+    return _pdf_file_response(request, token, "attachment")
 
 
 @router.post("/check")
-def check_pdf(file: UploadFile = File(...)):
-    path = save_upload_to_temp(file)
+def check_pdf(file: UploadFile = File(...), fast: bool = False):
     display_name = file.filename or "file.pdf"
+    token = None
 
     try:
+        # the upload is written once, to the path /pdf/{token} will serve
+        token, path = store_upload_for_view(file, display_name)
+
         # Per-request cache (bytes + reader + first pages text)
         ctx = PDFContext(path=path, display_name=display_name, max_pages_text=2)
 
         # Detection: reuse normalized text
-        detected = detect_bank_variant(path, text_norm=ctx.text_norm)
+        text_norm = ctx.text_norm
+        detected = detect_bank_variant(path, text_norm=text_norm)
 
         # Parsing: Phase 2B — pass cached text to parsers that support it
         try:
@@ -69,7 +105,7 @@ def check_pdf(file: UploadFile = File(...)):
                 detected.get("key", ""),
                 path,
                 text_raw=ctx.text_raw,
-                text_norm=ctx.text_norm,
+                text_norm=text_norm,
             )
         except Exception as e:
             data = {"error": f"{type(e).__name__}: {e}"}
@@ -85,9 +121,12 @@ def check_pdf(file: UploadFile = File(...)):
             display_name=display_name,
             pdf_bytes=ctx.pdf_bytes,
             pdf_reader=ctx.reader,
+            # ?fast=1: skip inflating + hashing page 0's content stream
+            fingerprint_page0=not fast,
+            # already hashed for the text cache
+            sha256=ctx.sha256,
         )
 
-        token = store_pdf_for_view(path, display_name)
         return {
             "message": f"Uploaded: {display_name}",
             "detected": detected,
@@ -98,6 +137,8 @@ def check_pdf(file: UploadFile = File(...)):
         }
 
     except Exception as e:
+        if token is not None:
+            discard_pdf(token)
         log.error(
             "Upload failed: %s (%s: %s)",
             getattr(file, "filename", None),
@@ -109,12 +150,6 @@ def check_pdf(file: UploadFile = File(...)):
             "error": f"{type(e).__name__}: {e}",
         }
 
-    finally:
-        try:
-            path.unlink(missing_ok=True)
-        except Exception:
-            pass
-
 
 @router.get("/healthz")
 def health():
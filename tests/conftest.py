@@ -0,0 +1,99 @@
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SAMPLES_DIR = ROOT / "data" / "uploads"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A fresh, empty PDF store in tmp_path (a worker that just started)."""
+    from app.services import pdf_store as ps
+
+    store_dir = tmp_path / "pdf_store"
+    store_dir.mkdir()
+    monkeypatch.setattr(ps, "PDF_STORE_DIR", store_dir)
+    monkeypatch.setattr(ps, "_INDEX", {})
+    monkeypatch.setattr(ps, "_EXPIRY", [])
+    monkeypatch.setattr(ps, "_MISSING", OrderedDict())
+    monkeypatch.setattr(ps, "_next_disk_sweep", time.time() + ps._DISK_SWEEP_SECONDS)
+    return store_dir
+
+# (label, value[, y]) rows; value None = a free-standing line, y (points from
+# the top) moves this row and the ones after it
+Rows = Sequence[tuple]
+
+# ZiraatKatilim-style receipt on an A4 page: header rows at the top, the
+# recipient block mid-page and the sorgu / FAST rows near the bottom
+ZK_RECEIPT: List[tuple] = [
+    ("Ziraat Katılım Bankası A.Ş.", None, 72),
+    ("DEKONT NO / FIS NO", "123456/789"),
+    ("İŞLEM TARİHİ", "12.03.2025 14:22:05"),
+    ("Gönderen Adı", "A*** B***"),
+    ("Alıcı Adı", "Ahmet Yaprak", 420),
+    ("Alıcı IBAN", "TR12 0020 9000 0123 4567 8900 01"),
+    ("Tutar", "1.250,00 TL"),
+    ("Sorgu Numarasi", "12345678", 720),
+    ("FAST", None),
+]
+
+
+@pytest.fixture
+def zk_receipt_rows() -> List[tuple]:
+    return list(ZK_RECEIPT)
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    """Build a text-layer PDF, one list of rows per page (PyMuPDF)."""
+    pymupdf = pytest.importorskip("pymupdf")
+
+    def make(pages: Sequence[Rows], name: str = "doc.pdf", jitter: float = 0.0) -> Path:
+        # builtin CJK fallback font: the only bundled one with Turkish glyphs
+        font = pymupdf.Font("cjk")
+        doc = pymupdf.open()
+        for rows in pages:
+            page = doc.new_page()
+            page.insert_font(fontname="F0", fontbuffer=font.buffer)
+            y = 72.0
+            for row in rows:
+                label, value = row[0], row[1]
+                if len(row) > 2:
+                    y = float(row[2])
+                page.insert_text((50, y), label, fontname="F0", fontsize=10)
+                if value is not None:
+                    # values sit a little off the label baseline, as in real receipts
+                    page.insert_text((200, y + jitter), f": {value}", fontname="F0", fontsize=10)
+                y += 18
+        out = tmp_path / name
+        doc.save(str(out))
+        doc.close()
+        return out
+
+    return make
+
+
+@pytest.fixture
+def image_only_pdf(tmp_path):
+    """Rasterize a PDF into an image-only copy (no text layer), like a scanned receipt."""
+    pymupdf = pytest.importorskip("pymupdf")
+
+    def make(src: Path, dpi: int = 200) -> Path:
+        out = tmp_path / f"scan_{src.name}"
+        with pymupdf.open(str(src)) as doc, pymupdf.open() as scan:
+            for page in doc:
+                pix = page.get_pixmap(dpi=dpi)
+                new = scan.new_page(width=page.rect.width, height=page.rect.height)
+                new.insert_image(new.rect, pixmap=pix)
+            scan.save(str(out))
+        return out
+
+    return make
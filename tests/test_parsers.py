@@ -0,0 +1,61 @@
+import pytest
+
+from app.parsers.enpara.parser import parse_enpara
+from app.parsers.garanti.parser import parse_garanti
+from app.parsers.ing.parser import parse_ing
+from app.parsers.isbank.parser import parse_isbank
+from app.parsers.pttbank.parser import parse_pttbank
+from app.parsers.qnb.parser import parse_qnb
+from app.parsers.teb.parser import parse_teb
+from app.parsers.tombank.parser import parse_tombank
+from app.parsers.turkiyefinans.parser import parse_turkiyefinans
+from app.parsers.vakifbank.parser import parse_vakifbank
+from app.parsers.vakifkatilim.parser import parse_vakifkatilim
+from app.services.pdf_context import PDFContext
+
+# a two-page receipt: the recipient / amount rows only on page 2, so a parser
+# handed a first-page-only text_raw would lose them
+_PAGE_1 = [
+    ("DEKONT", None, 72),
+    ("İŞLEM TARİHİ", "12.03.2025 14:22:05"),
+    ("GÖNDEREN", "MEHMET YILMAZ"),
+    ("GÖNDEREN IBAN", "TR33 0006 1005 1978 6457 8413 26"),
+]
+_PAGE_2 = [
+    ("ALICI", "AHMET YAPRAK", 72),
+    ("ALICI ADI SOYADI", "AHMET YAPRAK"),
+    ("ALICI IBAN", "TR12 0020 9000 0123 4567 8900 01"),
+    ("ALACAKLI IBAN", "TR12 0020 9000 0123 4567 8900 01"),
+    ("TUTAR", "1.250,00 TL"),
+    ("İŞLEM TUTARI", "1.250,00 TL"),
+    ("AÇIKLAMA", "KIRA"),
+    ("Tutar", None),  # label and value on separate lines
+    ("1.250,00 TL", None),
+    ("İŞLEM TUTARI 1.250,00 TL", None),  # inline, no colon
+    ("SORGU NO 12345678", None),
+]
+
+
+@pytest.mark.parametrize(
+    "parse",
+    [
+        parse_garanti,
+        parse_enpara,
+        parse_ing,
+        parse_isbank,
+        parse_pttbank,
+        parse_qnb,
+        parse_teb,
+        parse_tombank,
+        parse_turkiyefinans,
+        parse_vakifbank,
+        parse_vakifkatilim,
+    ],
+    ids=lambda f: f.__name__,
+)
+def test_request_text_matches_path_extraction(make_pdf, parse):
+    pdf = make_pdf([_PAGE_1, _PAGE_2])
+    ctx = PDFContext(path=pdf, max_pages_text=2)  # what /check builds
+    assert "1.250,00" in ctx.text_raw
+
+    assert parse(pdf, text_raw=ctx.text_raw, text_norm=ctx.text_norm) == parse(pdf)
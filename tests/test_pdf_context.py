@@ -0,0 +1,20 @@
+from app.services.pdf_context import PDFContext
+
+
+def test_text_raw_keeps_later_pages(make_pdf):
+    # a long first page that already carries the receipt labels
+    page1 = [("DEKONT", None), ("Tutar", "1.250,00 TL")]
+    page1 += [(f"Açıklama satırı {i}", "x" * 40) for i in range(40)]
+    page2 = [("Sorgu Numarasi", "99887766")]
+    pdf = make_pdf([page1, page2])
+
+    ctx = PDFContext(path=pdf, max_pages_text=2)
+    assert len(ctx.text_raw) > 2000
+    assert "99887766" in ctx.text_raw
+    assert "99887766" in ctx.text_norm
+
+
+def test_unreadable_file_has_no_text(tmp_path):
+    ctx = PDFContext(path=tmp_path / "missing.pdf")
+    assert ctx.text_raw == ""
+    assert ctx.text_norm == ""
@@ -0,0 +1,65 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services import pdf_meta
+from tests.conftest import ROOT, SAMPLES_DIR
+
+_BUNDLED = ROOT / "bin" / "exiftool" / "run_exiftool.sh"
+needs_exiftool = pytest.mark.skipif(
+    not (_BUNDLED.exists() and shutil.which("perl")) and not shutil.which("exiftool"),
+    reason="needs exiftool",
+)
+
+
+def _sample() -> Path:
+    return sorted(SAMPLES_DIR.glob("*.pdf"))[0]
+
+
+def _copy(src: Path, dst: Path, mtime: float) -> Path:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, dst)
+    os.utime(dst, (mtime, mtime))
+    return dst
+
+
+@needs_exiftool
+def test_system_only_run_matches_the_full_report(tmp_path):
+    pdf = _copy(_sample(), tmp_path / "a" / "tok__receipt.pdf", time.time() - 3600)
+    system, _ = pdf_meta._run_exiftool_raw(pdf, system_only=True)
+    raw, _ver = pdf_meta._run_exiftool_raw(pdf)
+    assert raw is not None
+
+    assert system and all(ln.startswith("[File:System]") for ln in system.splitlines())
+    assert system == "".join(pdf_meta._EXIF_SYSTEM_LINE_RE.findall(raw))
+
+
+@needs_exiftool
+def test_cache_hit_describes_the_new_upload(tmp_path):
+    src = _sample()
+    sha = pdf_meta._sha256(src.read_bytes())
+    pdf_meta._EXIF_CACHE.pop(sha, None)
+
+    first = _copy(src, tmp_path / "one" / "t1__first.pdf", time.time() - 7200)
+    second = _copy(src, tmp_path / "two" / "t2__second.pdf", time.time() - 60)
+
+    pdf_meta._run_exiftool_cached(first, "first.pdf", sha)
+    assert sha in pdf_meta._EXIF_CACHE
+    hit = pdf_meta._run_exiftool_cached(second, "second.pdf", sha)
+
+    assert str(first.parent) not in hit
+    assert str(second.parent) in hit
+    assert "first.pdf" not in hit
+    # same report an uncached run on the second upload gives
+    assert hit == pdf_meta._run_exiftool(second, "second.pdf")
+
+
+@needs_exiftool
+def test_report_shows_display_name_not_store_name(tmp_path):
+    pdf = _copy(_sample(), tmp_path / "tok123__receipt.pdf", time.time())
+    out = pdf_meta._run_exiftool(pdf, "receipt.pdf")
+    assert "tok123" not in out.replace(str(tmp_path), "")
+    assert "receipt.pdf" in out
@@ -0,0 +1,123 @@
+import io
+import os
+import secrets
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import pdf_store as ps
+
+
+@pytest.fixture
+def disk_scans(store, monkeypatch):
+    """Counts directory listings of the store."""
+    calls = []
+    orig = os.scandir
+
+    def counting(path="."):
+        if str(path) == str(store):
+            calls.append(path)
+        return orig(path)
+
+    monkeypatch.setattr(ps.os, "scandir", counting)
+    return calls
+
+
+class _Upload:
+    def __init__(self, data: bytes):
+        self.file = io.BytesIO(data)
+
+
+def _foreign_file(store, name="other.pdf", age=0.0, token=None):
+    """A file another worker stored (not in this worker's index)."""
+    token = token or secrets.token_urlsafe(16)
+    p = store / f"{token}__{name}"
+    p.write_bytes(b"%PDF-1.4\n")
+    t = time.time() - age
+    os.utime(p, (t, t))
+    return token, p
+
+
+def test_store_and_get(store):
+    token, path = ps.store_upload_for_view(_Upload(b"%PDF-1.4\n"), "receipt.pdf")
+
+    p, name, st = ps.get_pdf_with_stat(token)
+    assert p == path and p.parent == store
+    assert name == "receipt.pdf"
+    assert st.st_size == 9
+
+
+def test_expired_entry_is_removed(store):
+    token, path = ps.store_upload_for_view(_Upload(b"%PDF-1.4\n"), "receipt.pdf")
+
+    ps.cleanup_pdf_store(now=time.time() + ps.PDF_TTL_SECONDS + 1)
+
+    assert not path.exists()
+    with pytest.raises(HTTPException) as ei:
+        ps.get_pdf_with_stat(token)
+    assert ei.value.status_code == 404
+
+
+def test_foreign_token_is_found_on_disk(store, disk_scans):
+    token, path = _foreign_file(store)
+
+    assert ps.get_pdf_with_stat(token)[0] == path
+    assert ps.get_pdf_with_stat(token)[1] == "other.pdf"
+    assert len(disk_scans) == 1  # indexed on first use, no second scan
+
+
+def test_expired_foreign_token_is_404_and_deleted(store):
+    token, path = _foreign_file(store, age=ps.PDF_TTL_SECONDS + 5)
+
+    with pytest.raises(HTTPException):
+        ps.get_pdf_with_stat(token)
+    assert not path.exists()
+
+
+def test_missing_token_scans_the_disk_once(store, disk_scans):
+    token = secrets.token_urlsafe(16)
+    for _ in range(3):
+        with pytest.raises(HTTPException):
+            ps.get_pdf_with_stat(token)
+    assert len(disk_scans) == 1
+    assert token in ps._MISSING
+
+
+@pytest.mark.parametrize("token", ["", "x", "../etc/passwd", "a" * 23, "a" * 21 + "!", "a" * 21 + "."])
+def test_malformed_token_never_touches_the_disk(store, disk_scans, token):
+    with pytest.raises(HTTPException) as ei:
+        ps.get_pdf_with_stat(token)
+    assert ei.value.status_code == 404
+    assert disk_scans == []
+
+
+def test_token_containing_double_underscore(store):
+    token, path = _foreign_file(store, name="my__receipt.pdf", token="ab__" + "c" * 18)
+
+    p, name, _st = ps.get_pdf_with_stat(token)
+    assert p == path
+    assert name == "my__receipt.pdf"
+
+
+def test_restarted_worker_reindexes_and_expires_the_store(store):
+    live_token, live = _foreign_file(store, name="live.pdf")
+    old_token, old = _foreign_file(store, name="old.pdf", age=ps.PDF_TTL_SECONDS + 5)
+    (store / "stray.txt").write_text("not ours")
+
+    ps._index_from_disk()  # what a (re)started worker does at import
+    assert set(ps._INDEX) == {live_token, old_token}
+
+    ps.cleanup_pdf_store()
+    assert live.exists() and not old.exists()
+    assert (store / "stray.txt").exists()
+
+
+def test_periodic_sweep_expires_files_of_other_workers(store):
+    _token, orphan = _foreign_file(store, age=ps.PDF_TTL_SECONDS + 5)
+
+    ps.cleanup_pdf_store()  # sweep not due yet: this worker doesn't know the file
+    assert orphan.exists()
+
+    ps.cleanup_pdf_store(now=time.time() + ps._DISK_SWEEP_SECONDS + 1)
+    assert not orphan.exists()
@@ -0,0 +1,82 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.web import routes
+from app.web.routes import _etag_matches
+from tests.conftest import SAMPLES_DIR
+
+ETAG = '"0123abcd"'
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        (f' "other" ,W/{ETAG} ', True),
+        ("*", True),
+        ("", False),
+        ('"other"', False),
+        (f"{ETAG}x", False),  # contains the tag, but is a different one
+        ('"0123abc"', False),
+        ('"x0123abcd"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches(ETAG, header) is expected
+
+
+@pytest.fixture
+def client(store):
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def stored_token(client):
+    sample = sorted(SAMPLES_DIR.glob("*.pdf"))[0]
+    with sample.open("rb") as f:
+        r = client.post("/check", files={"file": ("receipt.pdf", f, "application/pdf")})
+    assert r.status_code == 200
+    return client, r.json()["view_url"].rsplit("/", 1)[1]
+
+
+def test_pdf_raw_conditional_get(stored_token):
+    client, token = stored_token
+    first = client.get(f"/pdf/{token}/raw")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"].startswith("private, max-age=")
+
+    assert client.get(f"/pdf/{token}/raw", headers={"If-None-Match": f'"x", W/{etag}'}).status_code == 304
+    assert client.get(f"/pdf/{token}/raw", headers={"If-None-Match": f"{etag}x"}).status_code == 200
+
+
+def test_failed_upload_discards_the_stored_file(client, store, monkeypatch):
+    def failing_detect(path, **kw):
+        raise RuntimeError("detector crashed")
+
+    monkeypatch.setattr(routes, "detect_bank_variant", failing_detect)
+
+    sample = sorted(SAMPLES_DIR.glob("*.pdf"))[0]
+    with sample.open("rb") as f:
+        r = client.post("/check", files={"file": ("receipt.pdf", f, "application/pdf")})
+
+    assert r.json()["error"] == "RuntimeError: detector crashed"
+    assert list(store.iterdir()) == []
+
+
+def test_store_failure_is_a_json_error(client, monkeypatch):
+    def full_disk(upload, display_name):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(routes, "store_upload_for_view", full_disk)
+
+    r = client.post("/check", files={"file": ("receipt.pdf", b"%PDF-1.4\n", "application/pdf")})
+
+    assert r.status_code == 200
+    assert r.json() == {
+        "message": "Upload failed: receipt.pdf",
+        "error": "OSError: [Errno 28] No space left on device",
+    }
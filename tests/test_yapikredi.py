@@ -0,0 +1,14 @@
+import pytest
+
+from app.parsers.yapikredi.parser import _sender_from_aciklama_block
+
+
+@pytest.mark.parametrize("sep", ["\n", "\r\n", "\r", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028"])
+def test_aciklama_block_splits_lines_like_splitlines(sep):
+    assert _sender_from_aciklama_block(f"AÇIKLAMA: x{sep}AYŞE\nVELİ\n") == "AYŞE"
+    assert _sender_from_aciklama_block(f"aciklama: x{sep}AYSE\nVELI\n") == "AYSE"
+
+
+def test_aciklama_block_skips_footer_lines():
+    raw = "AÇIKLAMA: kira\nWeb Adresi: www.example.com\nALİ IŞIKSOY\n"
+    assert _sender_from_aciklama_block(raw) == "ALİ IŞIKSOY"
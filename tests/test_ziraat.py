@@ -0,0 +1,18 @@
+import pytest
+
+from app.parsers.ziraat.parser import _find_fast_sorgu_no
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Fast Sorgu No : 123456789", "123456789"),
+        ("FAST SORGU NO:42", "42"),
+        ("FastSorguNo:\n987654", "987654"),
+        ("Fast Sorgu No 123456789", None),  # no separator: not the label
+        ("Sorgulama için müşteri no: 12345678901", None),
+        ("", None),
+    ],
+)
+def test_find_fast_sorgu_no(text, expected):
+    assert _find_fast_sorgu_no(text) == expected
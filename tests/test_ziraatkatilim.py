@@ -0,0 +1,85 @@
+import pytest
+
+from app.parsers.ziraatkatilim import parser as zk
+
+
+def _fields(raw: str) -> dict:
+    return zk._scan_fields(raw, zk._norm(raw))
+
+
+@pytest.mark.parametrize("jitter", [0.0, 0.6, 1.5])
+def test_text_layer_paths_agree(make_pdf, zk_receipt_rows, jitter):
+    # PyMuPDF rebuilds rows from word boxes; the pypdf fallback must parse the same
+    pdf = make_pdf([zk_receipt_rows], jitter=jitter)
+
+    via_pymupdf = _fields(zk._extract_text_layer(pdf))
+    via_pypdf = _fields(zk._text_layer_pypdf(pdf))
+
+    assert via_pymupdf == via_pypdf
+    assert via_pymupdf == {
+        "receiver_name": "Ahmet Yaprak",
+        "receiver_iban": "TR120020900001234567890001",
+        "amount": "1.250,00 TL",
+        "transaction_time": "12.03.2025 14:22:05",
+        "receipt_no": "123456/789",
+        "transaction_ref": "12345678",
+    }
+
+
+def _ocr_engine_available() -> bool:
+    import importlib.util
+    import shutil
+
+    if shutil.which("tesseract") is None or importlib.util.find_spec("PIL") is None:
+        return False
+    return any(importlib.util.find_spec(m) for m in ("tesserocr", "pytesseract"))
+
+
+@pytest.mark.skipif(not _ocr_engine_available(), reason="needs tesseract + PIL")
+def test_image_only_receipt_is_read_by_ocr(make_pdf, image_only_pdf, zk_receipt_rows):
+    scan = image_only_pdf(make_pdf([zk_receipt_rows]))
+    assert not zk._norm(zk._extract_text_layer(scan))
+
+    fields, n = zk._ocr_fields(scan)
+
+    assert fields["receiver_iban"] == "TR120020900001234567890001"
+    assert fields["amount"] == "1.250,00 TL"
+    assert fields["transaction_time"] and fields["receipt_no"] and fields["transaction_ref"]
+    assert zk._tr_status(n) == "completed"
+
+
+_PAGE_TXT = (
+    "DEKONT NO / FIS NO : 123456/789\n"
+    "İŞLEM TARİHİ : 12.03.2025 14:22:05\n"
+    "Alıcı Adı : Ahmet Yaprak\n"
+    "Alıcı IBAN : TR12 0020 9000 0123 4567 89OO 01\n"
+    "Tutar : 1.250,00 TL\n"
+    "Sorgu Numarasi : 12345678\n"
+)
+
+
+def _fake_ocr(monkeypatch, page_txt):
+    calls = []
+
+    def render(pdf_path, dpi):
+        calls.append(dpi)
+        return "page"
+
+    monkeypatch.setattr(zk, "_render_first_page", render)
+    monkeypatch.setattr(zk, "_ocr_image", lambda img: page_txt)
+    return calls
+
+
+def test_one_full_page_ocr(monkeypatch, tmp_path):
+    calls = _fake_ocr(monkeypatch, _PAGE_TXT)
+    fields, n = zk._ocr_fields(tmp_path / "x.pdf")
+
+    assert calls == [320]
+    assert fields == zk._scan_ocr(_PAGE_TXT)[0]
+    assert fields["receiver_iban"] == "TR120020900001234567890001"
+    assert zk._tr_status(n) == "completed"
+
+
+def test_no_ocr_text_keeps_text_layer(monkeypatch, tmp_path):
+    _fake_ocr(monkeypatch, "  \n")
+    assert zk._ocr_fields(tmp_path / "x.pdf") is None